@@ -4,11 +4,18 @@ Core module for strategy testing framework.
 
 from .base_strategy import BaseStrategy, Signal, MarketData
 from .strategy_engine import StrategyEngine, StrategyRegistry
+from .ring_buffer import RingBuffer
+from .book_view import BookView, book_view
+from .rolling_stats import RollingVar
 
 __all__ = [
     'BaseStrategy',
     'Signal', 
     'MarketData',
     'StrategyEngine',
-    'StrategyRegistry'
+    'StrategyRegistry',
+    'RingBuffer',
+    'BookView',
+    'book_view',
+    'RollingVar'
 ]
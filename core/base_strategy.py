@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+from .book_view import BookView, book_view
 
 
 @dataclass
@@ -48,6 +50,12 @@ class MarketData:
     metadata: Dict[str, Any] = None
     market_end_time: float = None
     
+    # Traded volume for this tick, when the feed provides it
+    volume: float = None
+    
+    # Parsed top of the order book, filled on first book() call
+    _book: Optional[BookView] = field(default=None, init=False, repr=False, compare=False)
+    
     def __post_init__(self):
         if self.exchange_prices is None:
             self.exchange_prices = {}
@@ -55,11 +63,21 @@ class MarketData:
             self.order_book = {}
         if self.metadata is None:
             self.metadata = {}
+    
+    def book(self) -> Optional[BookView]:
+        """Top of the order book as a BookView, parsed once and shared by all strategies."""
+        if self._book is None:
+            self._book = book_view(self.order_book)
+        return self._book
 
 
 class BaseStrategy(ABC):
     """Base class for all trading strategies."""
     
+    # Subclasses that declare their own __slots__ drop the per-instance
+    # __dict__; subclasses that don't keep working unchanged.
+    __slots__ = ('config', 'state', 'history')
+    
     name: str = "base_strategy"
     version: str = "1.0.0"
     
@@ -0,0 +1,34 @@
+"""
+Structure-of-arrays view of the top order book levels.
+
+Order books arrive as {'bids': [{'price': .., 'size': ..}, ...], 'asks': [...]}.
+Strategies whose detectors read several fields from several levels parse
+the top of the book once per tick into float tuples instead of going back
+to the level dicts in every detector.
+"""
+
+from typing import Any, Dict, NamedTuple, Optional
+
+
+class BookView(NamedTuple):
+    """Top-of-book prices and sizes per side, best level first."""
+    bid_px: tuple
+    bid_sz: tuple
+    ask_px: tuple
+    ask_sz: tuple
+
+
+def book_view(order_book: Optional[Dict[str, Any]], depth: int = 5) -> Optional[BookView]:
+    """Parse the top `depth` levels of each side; None when there is no book."""
+    if not order_book:
+        return None
+
+    bids = order_book.get('bids', [])[:depth]
+    asks = order_book.get('asks', [])[:depth]
+
+    return BookView(
+        tuple(float(b.get('price', 0)) for b in bids),
+        tuple(float(b.get('size', 0)) for b in bids),
+        tuple(float(a.get('price', 0)) for a in asks),
+        tuple(float(a.get('size', 0)) for a in asks),
+    )
@@ -0,0 +1,55 @@
+"""
+Fixed-capacity float ring buffer backed by a numpy array.
+
+Drop-in for the deque(maxlen=N) price histories used by strategies:
+appends never allocate, and the most recent k values come back as a
+view for numpy reductions instead of a fresh list copy.
+"""
+
+import numpy as np
+
+
+class RingBuffer:
+    """Fixed-size float64 ring buffer with deque-style append and indexing."""
+
+    __slots__ = ('maxlen', '_buf', '_idx', '_len')
+
+    def __init__(self, capacity: int):
+        self.maxlen = capacity
+        self._buf = np.zeros(capacity, dtype=np.float64)
+        self._idx = 0  # next write position
+        self._len = 0
+
+    def append(self, value: float):
+        """Add a value, overwriting the oldest once full."""
+        self._buf[self._idx] = value
+        self._idx = (self._idx + 1) % self.maxlen
+        if self._len < self.maxlen:
+            self._len += 1
+
+    def last_n(self, k: int) -> np.ndarray:
+        """
+        Most recent k values, oldest first.
+
+        A zero-copy view unless the range wraps around the end of the
+        buffer, in which case the two pieces are concatenated.
+        """
+        k = min(k, self._len)
+        start = (self._idx - k) % self.maxlen
+        end = start + k
+        if end <= self.maxlen:
+            return self._buf[start:end]
+        return np.concatenate((self._buf[start:], self._buf[:end - self.maxlen]))
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, index: int) -> float:
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("ring buffer index out of range")
+        return self._buf[(self._idx - self._len + index) % self.maxlen].item()
+
+    def __iter__(self):
+        return iter(self.last_n(self._len).tolist())
@@ -0,0 +1,72 @@
+"""
+O(1) rolling statistics over a sliding window.
+
+For strategies that recompute a windowed std every tick: the window
+moments are updated as values enter and leave instead of rescanning
+the window.
+"""
+
+import math
+from collections import deque
+
+
+class RollingVar:
+    """Sliding-window mean and variance (Welford), one O(1) update per push."""
+
+    __slots__ = ('window', 'n', 'mean', 'm2', 'buf', '_last', '_run', '_since_refresh')
+
+    def __init__(self, window: int):
+        self.window = window
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0  # sum of squared deviations from the mean
+        self.buf = deque(maxlen=window)
+        self._last = None
+        self._run = 0  # length of the trailing run of identical values
+        self._since_refresh = 0
+
+    def push(self, x: float):
+        """Add a value, dropping the oldest once the window is full."""
+        if self.n < self.window:
+            self.n += 1
+            delta = x - self.mean
+            self.mean += delta / self.n
+            self.m2 += delta * (x - self.mean)
+        else:
+            old = self.buf[0]
+            old_mean = self.mean
+            self.mean += (x - old) / self.n
+            self.m2 += (x - old) * (x - self.mean + old - old_mean)
+        self.buf.append(x)
+
+        # Once per window, recompute the moments from the buffer so rounding
+        # left behind by values that have since dropped out cannot build up
+        self._since_refresh += 1
+        if self._since_refresh >= self.window:
+            self._since_refresh = 0
+            mean = sum(self.buf) / self.n
+            self.mean = mean
+            self.m2 = sum((v - mean) ** 2 for v in self.buf)
+
+        if x == self._last:
+            self._run += 1
+        else:
+            self._last = x
+            self._run = 1
+
+    def __len__(self) -> int:
+        return self.n
+
+    def var(self, ddof: int = 0) -> float:
+        """Window variance; exactly 0 for a window of identical values."""
+        if self.n <= ddof:
+            return 0.0
+        # Removal can leave rounding residue in m2 that a flat window would
+        # otherwise report as a tiny nonzero variance
+        if self._run >= self.n or self.m2 < 0:
+            return 0.0
+        return self.m2 / (self.n - ddof)
+
+    def std(self, ddof: int = 0) -> float:
+        """Window standard deviation (ddof=0 matches np.std)."""
+        return math.sqrt(self.var(ddof))
@@ -51,7 +51,6 @@ from strategies.tick_size_arbitrage import TickSizeArbitrageStrategy
 from strategies.ivmr import IVMRStrategy
 from strategies.orderbook_imbalance import OrderBookImbalanceStrategy
 from strategies.time_decay_scalper import TimeDecayScalpingStrategy
-from strategies.spread_capture import SpreadCaptureStrategy
 from strategies.momentum_ignition import MomentumIgnitionStrategy
 from strategies.range_bound_mr import RangeBoundMeanReversionStrategy
 from strategies.liquidity_sweep import LiquiditySweepStrategy
@@ -72,7 +71,6 @@ from strategies.no_farming import NoFarmingStrategy
 from strategies.high_probability_compounding import HighProbabilityCompoundingStrategy
 from strategies.inventory_skew import InventorySkewStrategy
 from strategies.adverse_selection_flow import AdverseSelectionFilterStrategy
-from strategies.spread_capture import SpreadCaptureStrategy
 from strategies.latency_arbitrage import LatencyArbitrageStrategy
 from strategies.combinatorial_arbitrage import CombinatorialArbitrageStrategy
 from strategies.twap_detector import TWAPDetectorStrategy
@@ -164,7 +162,6 @@ class PaperTrader:
             IVMRStrategy(),  # NEW: Implied Volatility Mean Reversion
             OrderBookImbalanceStrategy(),  # NEW: Order book imbalance microstructure alpha
             TimeDecayScalpingStrategy(),  # NEW: Exploits time decay in short-term prediction markets
-            SpreadCaptureStrategy(),  # NEW: Capture bid-ask spread micro-inefficiencies
             MomentumIgnitionStrategy(),  # NEW: Trade momentum ignition and follow-through
             RangeBoundMeanReversionStrategy(),  # NEW: Mean reversion within identified price ranges
             LiquiditySweepStrategy(),  # NEW: Fade liquidity sweeps and capture reversals
@@ -185,7 +182,6 @@ class PaperTrader:
             HighProbabilityCompoundingStrategy(),  # NEW: High-probability auto-compounding
             InventorySkewStrategy(),  # NEW: Exploit market maker inventory skewing
             AdverseSelectionFilterStrategy(),  # NEW: Trade alongside informed flow
-            SpreadCaptureStrategy(),  # NEW: Capture spread compression profits
             LatencyArbitrageStrategy(),  # NEW: Exploit stale quotes during rapid moves
             CombinatorialArbitrageStrategy(),  # NEW: Probability mispricing arbitrage
             TWAPDetectorStrategy(),  # NEW: Detect and exploit institutional TWAP orders
@@ -22,10 +22,17 @@ Validation:
 
 from typing import Optional
 from collections import deque
-import statistics
-import time
+from operator import attrgetter
+
+import numpy as np
 
 from core.base_strategy import BaseStrategy, Signal, MarketData
+from core.ring_buffer import RingBuffer
+
+
+# One C-level call per tick instead of repeated attribute reads
+_get_time_price = attrgetter('timestamp', 'price')
+_get_book_quotes = attrgetter('order_book', 'bid', 'ask', 'mid')
 
 
 class LatencyArbitrageStrategy(BaseStrategy):
@@ -42,6 +49,18 @@ class LatencyArbitrageStrategy(BaseStrategy):
     This is a pure latency play - requires fast detection and execution.
     """
     
+    __slots__ = (
+        'price_history', 'velocity_history', '_price_append', '_velocity_append',
+        'velocity_threshold', 'strong_velocity',
+        'quote_update_history', 'max_staleness_seconds',
+        'min_arbitrage_bps', 'max_arbitrage_bps',
+        '_min_arbitrage_frac', '_max_arbitrage_frac',
+        'depth_levels',
+        'last_signal_time', 'cooldown_seconds',
+        'min_volume',
+        'velocity_count', 'last_velocity_direction', 'confirmation_periods',
+    )
+    
     name = "LatencyArbitrage"
     description = "Exploit stale quotes during rapid price moves"
     
@@ -50,8 +69,11 @@ class LatencyArbitrageStrategy(BaseStrategy):
         config = config or {}
         
         # Price velocity detection
-        self.price_history = deque(maxlen=10)
+        self.price_history = RingBuffer(10)
         self.velocity_history = deque(maxlen=20)
+        # Bound appends resolved once instead of per tick
+        self._price_append = self.price_history.append
+        self._velocity_append = self.velocity_history.append
         
         # Velocity thresholds (price change per second)
         self.velocity_threshold = self.config.get('velocity_threshold', 0.002)  # 0.2% per second
@@ -65,6 +87,11 @@ class LatencyArbitrageStrategy(BaseStrategy):
         self.min_arbitrage_bps = self.config.get('min_arbitrage_bps', 5)  # 5 bps minimum
         self.max_arbitrage_bps = self.config.get('max_arbitrage_bps', 50)  # Cap at 50 bps
         
+        # Same bounds as raw price fractions, so edges are only scaled to
+        # bps once they qualify
+        self._min_arbitrage_frac = self.min_arbitrage_bps / 10000
+        self._max_arbitrage_frac = self.max_arbitrage_bps / 10000
+        
         # Microprice calculation
         self.depth_levels = self.config.get('depth_levels', 3)
         
@@ -88,11 +115,10 @@ class LatencyArbitrageStrategy(BaseStrategy):
         if len(self.price_history) < 3:
             return 0.0, "neutral", 0.0
         
-        prices = list(self.price_history)
-        
-        # Calculate velocity over last few ticks
-        recent_prices = prices[-3:]
-        price_change = (recent_prices[-1] - recent_prices[0]) / recent_prices[0] if recent_prices[0] > 0 else 0
+        # Calculate velocity over last few ticks (direct indexing, no list copy)
+        first_price = self.price_history[-3]
+        last_price = self.price_history[-1]
+        price_change = (last_price - first_price) / first_price if first_price > 0 else 0
         
         # Assume ~1 second between updates for velocity calc
         velocity = abs(price_change)
@@ -120,11 +146,20 @@ class LatencyArbitrageStrategy(BaseStrategy):
         if not bids or not asks:
             return data.mid
         
+        return self._microprice(bids, asks, data)
+    
+    def _microprice(self, bids: list, asks: list, data: MarketData) -> float:
+        """Microprice from already-unpacked, non-empty book sides."""
         best_bid = float(bids[0].get('price', data.bid))
         best_ask = float(asks[0].get('price', data.ask))
         
-        bid_vol = sum(float(b.get('size', 0)) for b in bids[:self.depth_levels])
-        ask_vol = sum(float(a.get('size', 0)) for a in asks[:self.depth_levels])
+        # Plain loops: no slice copy or generator frame per tick
+        bid_vol = 0.0
+        for i in range(min(self.depth_levels, len(bids))):
+            bid_vol += float(bids[i].get('size', 0))
+        ask_vol = 0.0
+        for i in range(min(self.depth_levels, len(asks))):
+            ask_vol += float(asks[i].get('size', 0))
         total_vol = bid_vol + ask_vol
         
         if total_vol < self.min_volume:
@@ -138,7 +173,7 @@ class LatencyArbitrageStrategy(BaseStrategy):
         """
         Detect if current quotes are stale relative to fair value.
         
-        Returns: (is_arbitrage, trade_direction, edge_bps)
+        Returns: (is_arbitrage, trade_direction, edge_bps, fair_value)
         
         If price moved UP rapidly:
         - Old bids are too high (stale) → hit them (sell)
@@ -148,48 +183,49 @@ class LatencyArbitrageStrategy(BaseStrategy):
         - Old asks are too low (stale) → lift them (buy)
         - Fair value < ask → arbitrage
         """
-        if not data.order_book:
-            return False, "neutral", 0.0
+        order_book, bid, ask, mid = _get_book_quotes(data)
+        if not order_book:
+            return False, "neutral", 0.0, mid
         
-        bids = data.order_book.get('bids', [])
-        asks = data.order_book.get('asks', [])
+        bids = order_book.get('bids', [])
+        asks = order_book.get('asks', [])
         
         if not bids or not asks:
-            return False, "neutral", 0.0
+            return False, "neutral", 0.0, mid
         
-        best_bid = float(bids[0].get('price', data.bid))
-        best_ask = float(asks[0].get('price', data.ask))
+        best_bid = float(bids[0].get('price', bid))
+        best_ask = float(asks[0].get('price', ask))
         
-        # Calculate fair value
-        fair_value = self.calculate_microprice(data)
+        # Calculate fair value from the same unpacked book
+        fair_value = self._microprice(bids, asks, data)
         
         # Check for stale bid (price moved up, bid hasn't adjusted)
         if direction == "up" and velocity > self.velocity_threshold:
             # Fair value should be higher than bid after an up move
             if fair_value > best_bid:
-                edge = (fair_value - best_bid) / best_bid * 10000  # bps
-                if self.min_arbitrage_bps <= edge <= self.max_arbitrage_bps:
-                    return True, "up", edge  # Buy the stale bid (it's underpriced)
+                edge = (fair_value - best_bid) / best_bid
+                if self._min_arbitrage_frac <= edge <= self._max_arbitrage_frac:
+                    return True, "up", edge * 10000, fair_value  # Buy the stale bid (it's underpriced)
         
         # Check for stale ask (price moved down, ask hasn't adjusted)
         if direction == "down" and velocity > self.velocity_threshold:
             # Fair value should be lower than ask after a down move
             if fair_value < best_ask:
-                edge = (best_ask - fair_value) / best_ask * 10000  # bps
-                if self.min_arbitrage_bps <= edge <= self.max_arbitrage_bps:
-                    return True, "down", edge  # Sell the stale ask (it's overpriced)
+                edge = (best_ask - fair_value) / best_ask
+                if self._min_arbitrage_frac <= edge <= self._max_arbitrage_frac:
+                    return True, "down", edge * 10000, fair_value  # Sell the stale ask (it's overpriced)
         
-        return False, "neutral", 0.0
+        return False, "neutral", 0.0, fair_value
     
     def generate_signal(self, data: MarketData) -> Optional[Signal]:
-        current_time = data.timestamp
+        current_time, price = _get_time_price(data)
         
         # Cooldown check
         if current_time - self.last_signal_time < self.cooldown_seconds:
             return None
         
         # Update price history
-        self.price_history.append(data.price)
+        self._price_append(price)
         
         # Need enough history
         if len(self.price_history) < 5:
@@ -197,7 +233,7 @@ class LatencyArbitrageStrategy(BaseStrategy):
         
         # Calculate velocity
         velocity, direction, acceleration = self.calculate_price_velocity()
-        self.velocity_history.append(velocity)
+        self._velocity_append(velocity)
         
         # Need sufficient velocity for latency arbitrage
         if velocity < self.velocity_threshold:
@@ -217,7 +253,7 @@ class LatencyArbitrageStrategy(BaseStrategy):
             return None
         
         # Detect stale quote arbitrage opportunity
-        is_arb, trade_direction, edge_bps = self.detect_stale_quote_arbitrage(data, velocity, direction)
+        is_arb, trade_direction, edge_bps, fair_value = self.detect_stale_quote_arbitrage(data, velocity, direction)
         
         if is_arb:
             # Calculate confidence based on velocity and edge
@@ -240,9 +276,95 @@ class LatencyArbitrageStrategy(BaseStrategy):
                         'direction': direction,
                         'acceleration': acceleration,
                         'edge_bps': edge_bps,
-                        'fair_value': self.calculate_microprice(data),
+                        'fair_value': fair_value,
                         'velocity_count': self.velocity_count
                     }
                 )
         
         return None
+    
+    def generate_signals_batch(self, timestamps, prices, mids, best_bids, best_asks,
+                               bid_volumes, ask_volumes) -> np.ndarray:
+        """
+        Batch backtest path over full tick arrays.
+        
+        bid_volumes / ask_volumes are the summed sizes of the top
+        depth_levels book levels; use NaN best bid/ask for ticks without a
+        book. Reproduces generate_signal for a freshly constructed strategy
+        fed the same ticks in order, without touching instance state.
+        Returns an int8 array: 1 = up, -1 = down, 0 = no signal.
+        """
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        prices = np.asarray(prices, dtype=np.float64)
+        mids = np.asarray(mids, dtype=np.float64)
+        best_bids = np.asarray(best_bids, dtype=np.float64)
+        best_asks = np.asarray(best_asks, dtype=np.float64)
+        bid_volumes = np.asarray(bid_volumes, dtype=np.float64)
+        ask_volumes = np.asarray(ask_volumes, dtype=np.float64)
+        n = len(prices)
+        signals = np.zeros(n, dtype=np.int8)
+        
+        # Microprice fair value and stale-quote edges for every tick at once
+        with np.errstate(divide='ignore', invalid='ignore'):
+            total_vol = bid_volumes + ask_volumes
+            fair_value = np.where(
+                total_vol >= self.min_volume,
+                (best_bids * ask_volumes + best_asks * bid_volumes) / total_vol,
+                mids,
+            )
+            up_edge = (fair_value - best_bids) / best_bids
+            down_edge = (best_asks - fair_value) / best_asks
+            up_ok = (fair_value > best_bids) & (up_edge >= self._min_arbitrage_frac) & (up_edge <= self._max_arbitrage_frac)
+            down_ok = (fair_value < best_asks) & (down_edge >= self._min_arbitrage_frac) & (down_edge <= self._max_arbitrage_frac)
+        
+        # Cooldown skips history updates entirely, so velocity is path
+        # dependent; walk the ticks with plain floats over the arrays
+        threshold = self.velocity_threshold
+        last_signal_time = 0
+        recent = []  # last three prices that entered history
+        history_len = 0
+        velocity_count = 0
+        last_direction = 0
+        for i in range(n):
+            t = timestamps[i]
+            if t - last_signal_time < self.cooldown_seconds:
+                continue
+            
+            recent.append(prices[i])
+            if len(recent) > 3:
+                del recent[0]
+            history_len += 1
+            if history_len < 5:
+                continue
+            
+            first_price = recent[0]
+            price_change = (recent[-1] - first_price) / first_price if first_price > 0 else 0
+            velocity = abs(price_change)
+            if velocity < threshold:
+                velocity_count = 0
+                last_direction = 0
+                continue
+            
+            direction = 1 if price_change > 0 else -1 if price_change < 0 else 0
+            if direction == last_direction:
+                velocity_count += 1
+            else:
+                velocity_count = 1
+                last_direction = direction
+            if velocity_count < self.confirmation_periods or velocity <= threshold:
+                continue
+            
+            if direction == 1 and up_ok[i]:
+                edge_bps = up_edge[i] * 10000
+            elif direction == -1 and down_ok[i]:
+                edge_bps = down_edge[i] * 10000
+            else:
+                continue
+            
+            velocity_boost = min((velocity - threshold) / threshold * 0.1, 0.1)
+            confidence = min(0.62 + velocity_boost + min(edge_bps / 100, 0.1), 0.85)
+            if confidence >= self.min_confidence:
+                signals[i] = direction
+                last_signal_time = t
+        
+        return signals
@@ -15,10 +15,14 @@ Reference: "Market Microstructure & High-Frequency Trading" - Preston (2024)
 """
 
 from typing import Optional
+from bisect import bisect_left
 from collections import deque
-import statistics
+import math
 import time
 
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
 from core.base_strategy import BaseStrategy, Signal, MarketData
 
 
@@ -35,28 +39,52 @@ class SpreadCaptureStrategy(BaseStrategy):
     Works best in volatile but mean-reverting conditions.
     """
     
+    __slots__ = (
+        'spread_history', 'spread_percentiles',
+        'wide_spread_threshold', 'normal_spread_threshold',
+        'min_spread_bps', 'max_spread_bps',
+        'price_history', 'max_volatility',
+        'in_position', 'position_direction', 'entry_spread', 'entry_time',
+        'max_hold_seconds',
+        'last_signal_time', 'cooldown_seconds',
+        'min_volume',
+        '_spread_boost_offset',
+    )
+    
     name = "SpreadCapture"
     description = "Capture profits from bid-ask spread dynamics"
     
+    # Default config, merged once per instance instead of one .get() per key
+    _DEFAULTS = {
+        'wide_spread_threshold': 0.75,  # 75th percentile
+        'normal_spread_threshold': 0.50,  # 50th percentile
+        'min_spread_bps': 10,  # 0.1%
+        'max_spread_bps': 200,  # 2%
+        'max_volatility': 0.03,  # 3%
+        'max_hold_seconds': 120,
+        'cooldown_seconds': 45,
+        'min_volume': 500,
+    }
+    
     def __init__(self, config: dict = None):
         super().__init__(config)
-        config = config or {}
+        params = {**self._DEFAULTS, **self.config} if self.config else self._DEFAULTS
         
         # Spread tracking
         self.spread_history = deque(maxlen=50)
         self.spread_percentiles = deque(maxlen=50)
         
         # Entry/exit thresholds (percentile-based)
-        self.wide_spread_threshold = self.config.get('wide_spread_threshold', 0.75)  # 75th percentile
-        self.normal_spread_threshold = self.config.get('normal_spread_threshold', 0.50)  # 50th percentile
+        self.wide_spread_threshold = params['wide_spread_threshold']
+        self.normal_spread_threshold = params['normal_spread_threshold']
         
         # Minimum spread requirements
-        self.min_spread_bps = self.config.get('min_spread_bps', 10)  # 0.1%
-        self.max_spread_bps = self.config.get('max_spread_bps', 200)  # 2%
+        self.min_spread_bps = params['min_spread_bps']
+        self.max_spread_bps = params['max_spread_bps']
         
         # Volatility filter
         self.price_history = deque(maxlen=30)
-        self.max_volatility = self.config.get('max_volatility', 0.03)  # 3%
+        self.max_volatility = params['max_volatility']
         
         # Position tracking (for spread capture logic)
         self.in_position = False
@@ -65,24 +93,37 @@ class SpreadCaptureStrategy(BaseStrategy):
         self.entry_time = 0
         
         # Time decay
-        self.max_hold_seconds = self.config.get('max_hold_seconds', 120)
+        self.max_hold_seconds = params['max_hold_seconds']
         
         # Cooldown
         self.last_signal_time = 0
-        self.cooldown_seconds = self.config.get('cooldown_seconds', 45)
+        self.cooldown_seconds = params['cooldown_seconds']
         
         # Minimum volume
-        self.min_volume = self.config.get('min_volume', 500)
+        self.min_volume = params['min_volume']
+        
+        # (percentile - wide_spread_threshold) * 0.3 == percentile * 0.3 - offset
+        self._spread_boost_offset = self.wide_spread_threshold * 0.3
     
-    def calculate_spread_metrics(self, data: MarketData) -> dict:
+    def record_spread(self, data: MarketData) -> tuple:
         """
-        Calculate various spread metrics.
+        Append the current spread to history.
+        
+        Returns: (spread, spread_bps)
         """
         spread = data.ask - data.bid if data.ask > data.bid else 0
         mid = data.mid
         spread_bps = (spread / mid * 10000) if mid > 0 else 0
         
         self.spread_history.append(spread_bps)
+        return spread, spread_bps
+    
+    def calculate_spread_metrics(self, data: MarketData) -> dict:
+        """
+        Calculate various spread metrics.
+        """
+        spread, spread_bps = self.record_spread(data)
+        mid = data.mid
         
         metrics = {
             'current_spread': spread,
@@ -95,15 +136,15 @@ class SpreadCaptureStrategy(BaseStrategy):
         # Calculate percentiles if we have enough history
         if len(self.spread_history) >= 20:
             spreads = sorted(self.spread_history)
-            metrics['median_spread'] = statistics.median(spreads)
+            n = len(spreads)
+            metrics['median_spread'] = (spreads[(n - 1) // 2] + spreads[n // 2]) / 2
             metrics['p25'] = spreads[int(len(spreads) * 0.25)]
             metrics['p75'] = spreads[int(len(spreads) * 0.75)]
             metrics['p90'] = spreads[int(len(spreads) * 0.90)]
             
             # Current percentile
-            current = spread_bps
-            below_count = sum(1 for s in spreads if s < current)
-            metrics['current_percentile'] = below_count / len(spreads)
+            # Spreads are sorted, so the count below current is a bisection
+            metrics['current_percentile'] = bisect_left(spreads, spread_bps) / n
         else:
             metrics['median_spread'] = spread_bps
             metrics['p25'] = spread_bps * 0.5
@@ -119,10 +160,11 @@ class SpreadCaptureStrategy(BaseStrategy):
             return 0.0
         
         prices = list(self.price_history)
-        try:
-            return statistics.stdev(prices) / statistics.mean(prices) if len(prices) > 1 else 0
-        except:
+        n = len(prices)
+        avg = sum(prices) / n
+        if avg == 0:
             return 0.0
+        return math.sqrt(sum((p - avg) ** 2 for p in prices) / (n - 1)) / avg
     
     def detect_spread_opportunity(self, metrics: dict, data: MarketData) -> tuple:
         """
@@ -144,7 +186,7 @@ class SpreadCaptureStrategy(BaseStrategy):
         # Check if spread is wide (opportunity to capture compression)
         if percentile > self.wide_spread_threshold:
             # Determine direction based on price position within spread
-            mid = metrics['mid']
+            spread = metrics['current_spread']
             price = data.price
             
             # If price near bid, market is selling (potential up)
@@ -174,6 +216,12 @@ class SpreadCaptureStrategy(BaseStrategy):
         # Update history
         self.price_history.append(data.price)
         
+        # Cooldown check first: keep the spread history current but skip
+        # the percentile and volatility work while no signal can fire
+        if current_time - self.last_signal_time < self.cooldown_seconds:
+            self.record_spread(data)
+            return None
+        
         # Calculate spread metrics
         metrics = self.calculate_spread_metrics(data)
         
@@ -190,14 +238,10 @@ class SpreadCaptureStrategy(BaseStrategy):
         is_opp, direction, edge = self.detect_spread_opportunity(metrics, data)
         
         if is_opp:
-            # Cooldown check
-            if current_time - self.last_signal_time < self.cooldown_seconds:
-                return None
-            
             # Calculate confidence based on spread percentile and edge
             percentile = metrics.get('current_percentile', 0.5)
             base_conf = 0.58
-            spread_boost = (percentile - self.wide_spread_threshold) * 0.3
+            spread_boost = percentile * 0.3 - self._spread_boost_offset
             edge_boost = min(edge / 100, 0.10)  # Edge in bps / 100
             
             confidence = min(base_conf + spread_boost + edge_boost, 0.82)
@@ -219,3 +263,66 @@ class SpreadCaptureStrategy(BaseStrategy):
             )
         
         return None
+    
+    def generate_signals_batch(self, timestamps, bids, asks, mids, prices, volumes=None) -> np.ndarray:
+        """
+        Vectorized backtest path over full tick arrays.
+        
+        Reproduces generate_signal for a freshly constructed strategy fed
+        the same ticks in order, without touching instance state.
+        volumes holds each tick's MarketData.volume; leave it None (or use
+        0 / NaN for individual ticks) when the feed has no traded volume,
+        which skips the min_volume gate just as generate_signal does.
+        Returns an int8 array: 1 = up, -1 = down, 0 = no signal.
+        """
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        bids = np.asarray(bids, dtype=np.float64)
+        asks = np.asarray(asks, dtype=np.float64)
+        mids = np.asarray(mids, dtype=np.float64)
+        prices = np.asarray(prices, dtype=np.float64)
+        n = len(prices)
+        signals = np.zeros(n, dtype=np.int8)
+        if n < 20:
+            return signals
+        
+        spread_len = self.spread_history.maxlen
+        price_len = self.price_history.maxlen
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            spread = np.where(asks > bids, asks - bids, 0.0)
+            spread_bps = np.where(mids > 0, spread / mids * 10000, 0.0)
+            
+            # Percentile of the current spread within its (growing) history
+            padded = np.concatenate((np.full(spread_len - 1, np.nan), spread_bps))
+            below = (sliding_window_view(padded, spread_len) < spread_bps[:, None]).sum(axis=1)
+            history_len = np.minimum(np.arange(1, n + 1), spread_len)
+            percentile = np.where(history_len >= 20, below / history_len, 0.5)
+            
+            # Coefficient of variation of recent prices, 0 until 10 prices exist
+            padded = np.concatenate((np.full(price_len - 1, np.nan), prices))
+            windows = sliding_window_view(padded, price_len)[9:]
+            volatility = np.zeros(n)
+            volatility[9:] = np.nanstd(windows, axis=1, ddof=1) / np.nanmean(windows, axis=1)
+            
+            bid_distance = np.where(spread > 0, (prices - bids) / spread, 0.5)
+        
+        direction = np.where(bid_distance < 0.3, 1, np.where(bid_distance > 0.7, -1, 0))
+        candidate = (
+            (volatility <= self.max_volatility)
+            & (spread_bps <= self.max_spread_bps)
+            & (spread_bps >= self.min_spread_bps)
+            & (percentile > self.wide_spread_threshold)
+            & (direction != 0)
+        )
+        if volumes is not None:
+            volumes = np.asarray(volumes, dtype=np.float64)
+            candidate &= ~((volumes != 0) & (volumes < self.min_volume))
+        
+        # Cooldown is path dependent, so only the candidate ticks are walked
+        last_signal_time = 0
+        for i in np.flatnonzero(candidate):
+            if timestamps[i] - last_signal_time >= self.cooldown_seconds:
+                signals[i] = direction[i]
+                last_signal_time = timestamps[i]
+        
+        return signals
@@ -24,8 +24,12 @@ Validation:
 """
 
 from typing import Optional
+from bisect import bisect_left
 from collections import deque
-from statistics import mean, stdev
+import math
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 
 from core.base_strategy import BaseStrategy, Signal, MarketData
 
@@ -44,21 +48,42 @@ class SpreadScalperStrategy(BaseStrategy):
     the spread when it's temporarily inflated.
     """
     
+    __slots__ = (
+        'spread_history_len', 'wide_spread_multiplier', 'extreme_spread_multiplier',
+        'min_spread_bps', 'max_spread_bps',
+        'spread_history', 'price_history', 'return_history',
+        'min_confidence',
+        'cooldown_periods', 'last_signal_period', 'period_count',
+        'consecutive_signals', 'last_direction',
+        '_spread_boost_offset',
+    )
+    
     name = "SpreadScalper"
     description = "Capture bid-ask spread through liquidity provision"
     
+    # Default config, merged once per instance instead of one .get() per key
+    _DEFAULTS = {
+        'spread_history_len': 30,
+        'wide_spread_multiplier': 1.5,  # 1.5x avg
+        'extreme_spread_multiplier': 2.0,  # 2x avg
+        'min_spread_bps': 20,  # 0.2%
+        'max_spread_bps': 200,  # 2% - avoid chaos
+        'min_confidence': 0.60,
+        'cooldown_periods': 6,
+    }
+    
     def __init__(self, config: dict = None):
         super().__init__(config)
-        config = config or {}
+        params = {**self._DEFAULTS, **self.config} if self.config else self._DEFAULTS
         
         # Spread thresholds
-        self.spread_history_len = self.config.get('spread_history_len', 30)
-        self.wide_spread_multiplier = self.config.get('wide_spread_multiplier', 1.5)  # 1.5x avg
-        self.extreme_spread_multiplier = self.config.get('extreme_spread_multiplier', 2.0)  # 2x avg
+        self.spread_history_len = params['spread_history_len']
+        self.wide_spread_multiplier = params['wide_spread_multiplier']
+        self.extreme_spread_multiplier = params['extreme_spread_multiplier']
         
         # Minimum absolute spread (in bps)
-        self.min_spread_bps = self.config.get('min_spread_bps', 20)  # 0.2%
-        self.max_spread_bps = self.config.get('max_spread_bps', 200)  # 2% - avoid chaos
+        self.min_spread_bps = params['min_spread_bps']
+        self.max_spread_bps = params['max_spread_bps']
         
         # Spread tracking
         self.spread_history: deque = deque(maxlen=self.spread_history_len)
@@ -68,16 +93,19 @@ class SpreadScalperStrategy(BaseStrategy):
         self.return_history: deque = deque(maxlen=20)
         
         # Signal requirements
-        self.min_confidence = self.config.get('min_confidence', 0.60)
+        self.min_confidence = params['min_confidence']
         
         # Cooldown
-        self.cooldown_periods = self.config.get('cooldown_periods', 6)
+        self.cooldown_periods = params['cooldown_periods']
         self.last_signal_period = -self.cooldown_periods
         self.period_count = 0
         
         # Consecutive signal tracking
         self.consecutive_signals = 0
         self.last_direction = None
+        
+        # (spread_ratio - wide_spread_multiplier) * 0.2 == spread_ratio * 0.2 - offset
+        self._spread_boost_offset = self.wide_spread_multiplier * 0.2
     
     def calculate_spread_stats(self) -> tuple:
         """
@@ -88,17 +116,13 @@ class SpreadScalperStrategy(BaseStrategy):
             return 50, 20, 0.5  # Default values
         
         spreads = list(self.spread_history)
-        avg_spread = mean(spreads)
-        
-        try:
-            std_spread = stdev(spreads)
-        except:
-            std_spread = 20
+        n = len(spreads)
+        avg_spread = sum(spreads) / n
+        std_spread = math.sqrt(sum((s - avg_spread) ** 2 for s in spreads) / (n - 1))
         
         # Calculate percentile of most recent spread
         current = spreads[-1]
-        sorted_spreads = sorted(spreads)
-        percentile = sum(1 for s in sorted_spreads if s < current) / len(sorted_spreads)
+        percentile = bisect_left(sorted(spreads), current) / n
         
         return avg_spread, std_spread, percentile
     
@@ -108,10 +132,8 @@ class SpreadScalperStrategy(BaseStrategy):
             return 0.01
         
         returns = list(self.return_history)[-10:]
-        try:
-            return stdev(returns)
-        except:
-            return 0.01
+        avg = sum(returns) / 10
+        return math.sqrt(sum((r - avg) ** 2 for r in returns) / 9)
     
     def generate_signal(self, data: MarketData) -> Optional[Signal]:
         current_price = data.price
@@ -126,11 +148,11 @@ class SpreadScalperStrategy(BaseStrategy):
         self.price_history.append(current_price)
         
         if len(self.price_history) >= 2:
-            prev_price = list(self.price_history)[-2]
+            prev_price = self.price_history[-2]
             ret = (current_price - prev_price) / prev_price if prev_price > 0 else 0
             self.return_history.append(ret)
         
-        # Check cooldown
+        # Check cooldown before any stats work (buffers above stay current)
         if self.period_count - self.last_signal_period < self.cooldown_periods:
             return None
         
@@ -162,32 +184,30 @@ class SpreadScalperStrategy(BaseStrategy):
         
         signal = None
         confidence = 0.0
-        reason = ""
         
         if bid_distance < 0.4:
             # Price near bid = selling pressure
             # Spread scalping: buy near bid, profit when spread compresses
             signal = "up"
-            base_conf = 0.60
-            spread_boost = min((spread_ratio - self.wide_spread_multiplier) * 0.2, 0.15)
-            vol_adjustment = max(0, 0.05 - volatility * 2)  # Lower conf in high vol
-            confidence = base_conf + spread_boost + vol_adjustment
-            reason = f"Wide spread ({spread_bps:.0f}bps, {spread_ratio:.1f}x avg), price near bid - capture spread"
+            side = "bid"
         
         elif bid_distance > 0.6:
             # Price near ask = buying pressure
             # Spread scalping: sell near ask, profit when spread compresses
             signal = "down"
+            side = "ask"
+        
+        if signal:
+            # Same confidence model on both sides
             base_conf = 0.60
-            spread_boost = min((spread_ratio - self.wide_spread_multiplier) * 0.2, 0.15)
-            vol_adjustment = max(0, 0.05 - volatility * 2)
+            spread_boost = min(spread_ratio * 0.2 - self._spread_boost_offset, 0.15)
+            vol_adjustment = max(0, 0.05 - volatility * 2)  # Lower conf in high vol
             confidence = base_conf + spread_boost + vol_adjustment
-            reason = f"Wide spread ({spread_bps:.0f}bps, {spread_ratio:.1f}x avg), price near ask - capture spread"
         
         # Extra boost for extreme spreads
-        if spread_ratio > self.extreme_spread_multiplier and signal:
+        is_extreme = signal is not None and spread_ratio > self.extreme_spread_multiplier
+        if is_extreme:
             confidence += 0.05
-            reason += " [EXTREME SPREAD]"
         
         if signal and confidence >= self.min_confidence:
             # Track consecutive signals
@@ -201,6 +221,11 @@ class SpreadScalperStrategy(BaseStrategy):
             
             self.last_signal_period = self.period_count
             
+            # Reason is only formatted once the signal is confirmed
+            reason = f"Wide spread ({spread_bps:.0f}bps, {spread_ratio:.1f}x avg), price near {side} - capture spread"
+            if is_extreme:
+                reason += " [EXTREME SPREAD]"
+            
             return Signal(
                 strategy=self.name,
                 signal=signal,
@@ -217,3 +242,64 @@ class SpreadScalperStrategy(BaseStrategy):
             )
         
         return None
+    
+    def generate_signals_batch(self, bids, asks, mids, prices) -> np.ndarray:
+        """
+        Vectorized backtest path over full tick arrays.
+        
+        Reproduces generate_signal for a freshly constructed strategy fed
+        the same ticks in order, without touching instance state.
+        Returns an int8 array: 1 = up, -1 = down, 0 = no signal.
+        """
+        bids = np.asarray(bids, dtype=np.float64)
+        asks = np.asarray(asks, dtype=np.float64)
+        mids = np.asarray(mids, dtype=np.float64)
+        prices = np.asarray(prices, dtype=np.float64)
+        n = len(prices)
+        signals = np.zeros(n, dtype=np.int8)
+        if n < 15:
+            return signals
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            spread = asks - bids
+            spread_bps = np.where(mids > 0, spread / mids * 10000, 0.0)
+            
+            # Rolling spread average (history grows until spread_history_len)
+            padded = np.concatenate((np.full(self.spread_history_len - 1, np.nan), spread_bps))
+            avg_spread = np.nanmean(sliding_window_view(padded, self.spread_history_len), axis=1)
+            spread_ratio = np.where(avg_spread > 0, spread_bps / avg_spread, 1.0)
+            
+            # Stdev of the last 10 returns, 0.01 until 10 returns exist
+            returns = np.zeros(n)
+            prev = prices[:-1]
+            returns[1:] = np.where(prev > 0, (prices[1:] - prev) / prev, 0.0)
+            volatility = np.full(n, 0.01)
+            volatility[10:] = sliding_window_view(returns[1:], 10).std(axis=1, ddof=1)
+            
+            bid_distance = np.where(spread > 0, (prices - bids) / spread, 0.5)
+        
+        direction = np.where(bid_distance < 0.4, 1, np.where(bid_distance > 0.6, -1, 0))
+        confidence = (
+            0.60
+            + np.minimum((spread_ratio - self.wide_spread_multiplier) * 0.2, 0.15)
+            + np.maximum(0, 0.05 - volatility * 2)
+            + np.where(spread_ratio > self.extreme_spread_multiplier, 0.05, 0.0)
+        )
+        candidate = (
+            (np.arange(n) >= 14)
+            & (spread_bps >= self.min_spread_bps)
+            & (spread_bps <= self.max_spread_bps)
+            & (spread_ratio >= self.wide_spread_multiplier)
+            & (direction != 0)
+            & (confidence >= self.min_confidence)
+        )
+        
+        # Cooldown is path dependent, so only the candidate ticks are walked
+        last_signal_period = -self.cooldown_periods
+        for i in np.flatnonzero(candidate):
+            period = i + 1
+            if period - last_signal_period >= self.cooldown_periods:
+                signals[i] = direction[i]
+                last_signal_period = period
+        
+        return signals
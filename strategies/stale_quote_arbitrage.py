@@ -14,8 +14,24 @@ Edge: Capture mispricing when YES + NO < $1.00 (guaranteed profit at settlement)
 """
 
 import numpy as np
+from collections import deque
+from operator import attrgetter
 from typing import Dict, Any, Optional, Tuple
-from core.base_strategy import BaseStrategy
+from core.base_strategy import BaseStrategy, MarketData
+
+
+_get_md = attrgetter('metadata', 'order_book', 'timestamp')
+
+
+def _unpack_market_data(data: MarketData) -> Tuple[float, float, Dict[str, Any], float]:
+    """Fast path for exact MarketData instances: one metadata read, no type checks."""
+    md, order_book, timestamp = _get_md(data)
+    if md:
+        yes_price = md.get('yes_price', 0.5)
+        no_price = md.get('no_price', 0.5)
+    else:
+        yes_price = no_price = 0.5
+    return yes_price, no_price, order_book or {}, timestamp
 
 
 class StaleQuoteArbitrage(BaseStrategy):
@@ -27,11 +43,17 @@ class StaleQuoteArbitrage(BaseStrategy):
     and captures these opportunities.
     """
     
+    __slots__ = (
+        'min_arbitrage', 'max_position_hold', 'min_liquidity', 'position_size',
+        'arbitrage_history', '_arbitrage_append', 'last_trade_time',
+    )
+    
+    name = "StaleQuoteArbitrage"
+    description = "Exploits stale quotes when YES + NO ≠ $1.00"
+    
     def __init__(self, config: Dict[str, Any] = None):
         super().__init__(config)
         config = config or {}
-        self.name = "StaleQuoteArbitrage"
-        self.description = "Exploits stale quotes when YES + NO ≠ $1.00"
         
         # Strategy parameters
         self.min_arbitrage = config.get('min_arbitrage', 0.005)  # Min 0.5% arbitrage
@@ -40,7 +62,8 @@ class StaleQuoteArbitrage(BaseStrategy):
         self.position_size = config.get('position_size', 1.0)
         
         # State tracking
-        self.arbitrage_history = []
+        self.arbitrage_history = deque(maxlen=50)  # (timestamp, sum_price, arbitrage)
+        self._arbitrage_append = self.arbitrage_history.append  # bound once, not per tick
         self.last_trade_time = 0
         
     def calculate_arbitrage(self, yes_price: float, no_price: float) -> Tuple[float, float]:
@@ -77,42 +100,42 @@ class StaleQuoteArbitrage(BaseStrategy):
             Signal dict or None
         """
         # Handle both dict and MarketData objects
-        if hasattr(data, 'metadata'):
-            # MarketData object - extract from metadata
+        if data.__class__ is MarketData:
+            # Hot production path
+            yes_price, no_price, orderbook, current_time = _unpack_market_data(data)
+        elif hasattr(data, 'metadata'):
+            # MarketData-like object - extract from metadata
             yes_price = data.metadata.get('yes_price', 0.5) if data.metadata else 0.5
             no_price = data.metadata.get('no_price', 0.5) if data.metadata else 0.5
             orderbook = data.order_book or {}
             current_time = data.timestamp
+        elif isinstance(data, dict):
+            yes_price = data.get('yes_price', 0.5)
+            no_price = data.get('no_price', 0.5)
+            orderbook = data.get('orderbook', {})
+            current_time = data.get('timestamp', 0)
         else:
-            # Dict object
-            yes_price = data.get('yes_price', 0.5) if isinstance(data, dict) else 0.5
-            no_price = data.get('no_price', 0.5) if isinstance(data, dict) else 0.5
-            orderbook = data.get('orderbook', {}) if isinstance(data, dict) else {}
-            current_time = data.get('timestamp', 0) if isinstance(data, dict) else 0
+            yes_price = no_price = 0.5
+            orderbook = {}
+            current_time = 0
         
         # Calculate arbitrage
         sum_price, arbitrage = self.calculate_arbitrage(yes_price, no_price)
         
         # Track history
-        self.arbitrage_history.append({
-            'timestamp': current_time,
-            'sum_price': sum_price,
-            'arbitrage': arbitrage
-        })
-        
-        if len(self.arbitrage_history) > 50:
-            self.arbitrage_history.pop(0)
+        self._arbitrage_append((current_time, sum_price, arbitrage))
         
         # Check if arbitrage opportunity exists
         if arbitrage < self.min_arbitrage:
             return None
         
-        # Check liquidity
-        if not self.check_liquidity(orderbook):
+        # Rate limiting - don't trade too frequently (checked before the
+        # order book lookups; history above stays complete for the stats)
+        if current_time - self.last_trade_time < 30:
             return None
         
-        # Rate limiting - don't trade too frequently
-        if current_time - self.last_trade_time < 30:
+        # Check liquidity
+        if not self.check_liquidity(orderbook):
             return None
         
         # Calculate expected return
@@ -144,6 +167,28 @@ class StaleQuoteArbitrage(BaseStrategy):
             'timestamp': current_time
         }
     
+    def generate_signals_batch(self, timestamps, yes_prices, no_prices,
+                               yes_liquidity, no_liquidity) -> np.ndarray:
+        """
+        Vectorized backtest path over full tick arrays.
+        
+        Reproduces generate_signal for a freshly constructed strategy fed
+        the same ticks in order, without touching instance state.
+        Returns an int8 array: 1 = UP, -1 = DOWN, 0 = no signal.
+        """
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        yes_prices = np.asarray(yes_prices, dtype=np.float64)
+        no_prices = np.asarray(no_prices, dtype=np.float64)
+        
+        arbitrage = 1.0 - (yes_prices + no_prices)
+        fire = (
+            (arbitrage >= self.min_arbitrage)
+            & (np.asarray(yes_liquidity) >= self.min_liquidity)
+            & (np.asarray(no_liquidity) >= self.min_liquidity)
+            & (timestamps - self.last_trade_time >= 30)
+        )
+        return np.where(fire, np.where(yes_prices < no_prices, 1, -1), 0).astype(np.int8)
+    
     def calculate_position_size(self, signal: Dict[str, Any]) -> float:
         """Calculate position size based on arbitrage size."""
         base_size = self.position_size
@@ -194,7 +239,7 @@ class StaleQuoteArbitrage(BaseStrategy):
         if not self.arbitrage_history:
             return {}
         
-        arbitrages = [a['arbitrage'] for a in self.arbitrage_history]
+        arbitrages = [a[2] for a in self.arbitrage_history]
         return {
             'avg_arbitrage': np.mean(arbitrages),
             'max_arbitrage': np.max(arbitrages),
@@ -13,9 +13,12 @@ Reference: Research on CLOB microstructure and tick-size effects
 
 from typing import Optional
 from collections import deque
-import statistics
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 
 from core.base_strategy import BaseStrategy, Signal, MarketData
+from core.ring_buffer import RingBuffer
 
 
 class TickSizeArbitrageStrategy(BaseStrategy):
@@ -32,6 +35,15 @@ class TickSizeArbitrageStrategy(BaseStrategy):
     order flow imbalance.
     """
     
+    __slots__ = (
+        'tick_size_normal', 'tick_size_extreme',
+        '_ticks_per_unit_normal', '_ticks_per_unit_extreme',
+        'extreme_low', 'extreme_high',
+        'tick_proximity',
+        'flow_lookback', 'flow_history', '_flow_append',
+        'price_history', '_price_append',
+    )
+    
     name = "TickSizeArbitrage"
     description = "Exploits tick-size regime changes and micro-inefficiencies"
     
@@ -43,6 +55,10 @@ class TickSizeArbitrageStrategy(BaseStrategy):
         self.tick_size_normal = self.config.get('tick_size_normal', 0.01)  # 1 cent
         self.tick_size_extreme = self.config.get('tick_size_extreme', 0.001)  # 0.1 cent near extremes
         
+        # Ticks per unit price, so tick lookups multiply instead of divide
+        self._ticks_per_unit_normal = 1.0 / self.tick_size_normal
+        self._ticks_per_unit_extreme = 1.0 / self.tick_size_extreme
+        
         # Extreme zone boundaries
         self.extreme_low = self.config.get('extreme_low', 0.05)
         self.extreme_high = self.config.get('extreme_high', 0.95)
@@ -53,9 +69,11 @@ class TickSizeArbitrageStrategy(BaseStrategy):
         # Order flow lookback
         self.flow_lookback = self.config.get('flow_lookback', 5)
         self.flow_history = deque(maxlen=self.flow_lookback)
+        self._flow_append = self.flow_history.append
         
         # Price history for tick detection
-        self.price_history = deque(maxlen=20)
+        self.price_history = RingBuffer(20)
+        self._price_append = self.price_history.append
     
     def get_tick_size(self, price: float) -> float:
         """Get effective tick size at given price."""
@@ -65,33 +83,40 @@ class TickSizeArbitrageStrategy(BaseStrategy):
     
     def find_nearest_tick(self, price: float, tick_size: float) -> float:
         """Find nearest tick level."""
-        return round(price / tick_size) * tick_size
+        if tick_size == self.tick_size_extreme:
+            ticks_per_unit = self._ticks_per_unit_extreme
+        elif tick_size == self.tick_size_normal:
+            ticks_per_unit = self._ticks_per_unit_normal
+        else:
+            ticks_per_unit = 1.0 / tick_size
+        # Prices are non-negative, so truncating x + 0.5 rounds to nearest
+        return int(price * ticks_per_unit + 0.5) * tick_size
     
     def calculate_tick_proximity(self, price: float, tick_size: float) -> float:
         """Calculate distance to nearest tick boundary."""
-        nearest = self.find_nearest_tick(price, tick_size)
-        next_tick = nearest + tick_size if price >= nearest else nearest - tick_size
-        
-        # Distance to nearest tick as fraction of tick size
-        dist_to_nearest = abs(price - nearest)
-        dist_to_next = abs(price - next_tick)
-        
-        return min(dist_to_nearest, dist_to_next)
+        # The nearest tick is never farther than the next one over
+        return abs(price - self.find_nearest_tick(price, tick_size))
     
     def calculate_order_flow_imbalance(self, data: MarketData) -> float:
         """Calculate order flow imbalance from recent trades/orders."""
-        if not data.order_book:
+        order_book = data.order_book
+        if not order_book:
             return 0.0
         
-        bids = data.order_book.get('bids', [])
-        asks = data.order_book.get('asks', [])
+        bids = order_book.get('bids', [])
+        asks = order_book.get('asks', [])
         
         if not bids or not asks:
             return 0.0
         
-        # Calculate top-of-book imbalance
-        bid_vol = sum(float(b.get('size', 0)) for b in bids[:3])
-        ask_vol = sum(float(a.get('size', 0)) for a in asks[:3])
+        # Calculate top-of-book imbalance (plain loops: no slice copy or
+        # generator frame per tick)
+        bid_vol = 0.0
+        for i in range(min(3, len(bids))):
+            bid_vol += float(bids[i].get('size', 0))
+        ask_vol = 0.0
+        for i in range(min(3, len(asks))):
+            ask_vol += float(asks[i].get('size', 0))
         
         if bid_vol + ask_vol == 0:
             return 0.0
@@ -103,67 +128,73 @@ class TickSizeArbitrageStrategy(BaseStrategy):
         price = data.price
         
         # Store history
-        self.price_history.append(price)
-        
-        # Calculate order flow
-        flow = self.calculate_order_flow_imbalance(data)
-        self.flow_history.append(flow)
+        self._price_append(price)
         
         # Get effective tick size
-        tick_size = self.get_tick_size(price)
+        if price < self.extreme_low or price > self.extreme_high:
+            tick_size = self.tick_size_extreme
+            ticks_per_unit = self._ticks_per_unit_extreme
+        else:
+            tick_size = self.tick_size_normal
+            ticks_per_unit = self._ticks_per_unit_normal
         
-        # Find nearest tick
-        nearest_tick = self.find_nearest_tick(price, tick_size)
+        # Find nearest tick (index on the tick grid, no division)
+        nearest_tick = int(price * ticks_per_unit + 0.5) * tick_size
         
         # Calculate proximity to tick boundary
-        proximity = self.calculate_tick_proximity(price, tick_size)
+        proximity = abs(price - nearest_tick)
         
         # Only trade near tick boundaries
         if proximity > self.tick_proximity:
             return None
         
+        # Calculate order flow. Tradeoff: the book is only scanned on ticks
+        # that pass the proximity filter, so flow_history averages the most
+        # recent near-boundary ticks rather than the most recent ticks
+        # overall, and warms up more slowly. In exchange the scan is skipped
+        # on the large majority of ticks, which are far from a boundary.
+        flow = self.calculate_order_flow_imbalance(data)
+        self._flow_append(flow)
+        
         # Need order flow history
         if len(self.flow_history) < 3:
             return None
         
-        # Average recent flow
-        avg_flow = statistics.mean(self.flow_history)
+        # Average recent flow (summed fresh: the window is only
+        # flow_lookback values, and a rolling sum would drift)
+        avg_flow = sum(self.flow_history) / len(self.flow_history)
         
-        signal = None
-        confidence = 0.0
-        reason = ""
-        
-        # Determine which tick we're closer to
-        dist_to_lower = abs(price - (nearest_tick - tick_size))
-        dist_to_upper = abs(price - (nearest_tick + tick_size))
-        closer_to_upper = dist_to_upper < dist_to_lower
+        # Determine which neighbouring tick we're closer to: within half a
+        # tick of nearest_tick, the upper one is closer iff price is above it
+        closer_to_upper = price > nearest_tick
         
         # Signal logic: flow direction + tick proximity
         if avg_flow > 0.3:  # Strong bid pressure
-            if closer_to_upper:
-                # Pressure pushing toward upper tick
-                confidence = min(0.6 + avg_flow * 0.3, 0.85)
-                signal = "up"
-                reason = f"Tick arb: bid pressure {avg_flow:.2f}, near upper tick {nearest_tick + tick_size:.3f}"
-            else:
-                # Already at lower tick, pressure pushing away
-                confidence = min(0.55 + avg_flow * 0.2, 0.75)
-                signal = "up"
-                reason = f"Tick arb: bid pressure {avg_flow:.2f}, pushing from lower tick"
-        
+            signal, side, abs_flow = "up", "bid", avg_flow
+            toward, away = "upper", "lower"
+            target_tick = nearest_tick + tick_size
+            # Pressure pushing toward upper tick, or away from the lower one
+            toward_tick = closer_to_upper
         elif avg_flow < -0.3:  # Strong ask pressure
-            if not closer_to_upper:
-                # Pressure pushing toward lower tick
-                confidence = min(0.6 + abs(avg_flow) * 0.3, 0.85)
-                signal = "down"
-                reason = f"Tick arb: ask pressure {abs(avg_flow):.2f}, near lower tick {nearest_tick - tick_size:.3f}"
-            else:
-                # Already at upper tick, pressure pushing away
-                confidence = min(0.55 + abs(avg_flow) * 0.2, 0.75)
-                signal = "down"
-                reason = f"Tick arb: ask pressure {abs(avg_flow):.2f}, pushing from upper tick"
+            signal, side, abs_flow = "down", "ask", -avg_flow
+            toward, away = "lower", "upper"
+            target_tick = nearest_tick - tick_size
+            # Pressure pushing toward lower tick, or away from the upper one
+            toward_tick = not closer_to_upper
+        else:
+            return None
+        
+        if toward_tick:
+            confidence = min(0.6 + abs_flow * 0.3, 0.85)
+        else:
+            confidence = min(0.55 + abs_flow * 0.2, 0.75)
         
-        if signal and confidence >= self.min_confidence:
+        if confidence >= self.min_confidence:
+            if toward_tick:
+                reason = f"Tick arb: {side} pressure {abs_flow:.2f}, near {toward} tick {target_tick:.3f}"
+            else:
+                reason = f"Tick arb: {side} pressure {abs_flow:.2f}, pushing from {away} tick"
+            
             return Signal(
                 strategy=self.name,
                 signal=signal,
@@ -180,3 +211,56 @@ class TickSizeArbitrageStrategy(BaseStrategy):
             )
         
         return None
+    
+    def generate_signals_batch(self, prices, bid_volumes, ask_volumes) -> np.ndarray:
+        """
+        Vectorized backtest path over full tick arrays.
+        
+        bid_volumes / ask_volumes are the summed sizes of the top three book
+        levels per tick (0 for ticks without a book). Reproduces
+        generate_signal for a freshly constructed strategy fed the same
+        ticks in order, without touching instance state.
+        Returns an int8 array: 1 = up, -1 = down, 0 = no signal.
+        """
+        prices = np.asarray(prices, dtype=np.float64)
+        bid_volumes = np.asarray(bid_volumes, dtype=np.float64)
+        ask_volumes = np.asarray(ask_volumes, dtype=np.float64)
+        signals = np.zeros(len(prices), dtype=np.int8)
+        
+        extreme = (prices < self.extreme_low) | (prices > self.extreme_high)
+        tick_size = np.where(extreme, self.tick_size_extreme, self.tick_size_normal)
+        ticks_per_unit = np.where(extreme, self._ticks_per_unit_extreme, self._ticks_per_unit_normal)
+        nearest_tick = np.floor(prices * ticks_per_unit + 0.5) * tick_size
+        
+        # Flow history only advances on ticks near a boundary
+        near = np.flatnonzero(np.abs(prices - nearest_tick) <= self.tick_proximity)
+        if len(near) < 3 or self.flow_lookback < 3:
+            return signals
+        
+        total = bid_volumes[near] + ask_volumes[near]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            flow = np.where(total != 0, (bid_volumes[near] - ask_volumes[near]) / total, 0.0)
+        # Window sums added oldest first, the same order as sum(flow_history)
+        # in generate_signal, so averages round identically
+        lookback = self.flow_lookback
+        windows = sliding_window_view(np.concatenate((np.zeros(lookback - 1), flow)), lookback)
+        flow_sum = np.zeros(len(flow))
+        for j in range(lookback):
+            flow_sum += windows[:, j]
+        avg_flow = flow_sum / np.minimum(np.arange(1, len(flow) + 1), lookback)
+        
+        up = avg_flow > 0.3
+        down = avg_flow < -0.3
+        abs_flow = np.abs(avg_flow)
+        closer_to_upper = prices[near] > nearest_tick[near]
+        toward_tick = np.where(up, closer_to_upper, ~closer_to_upper)
+        confidence = np.where(
+            toward_tick,
+            np.minimum(0.6 + abs_flow * 0.3, 0.85),
+            np.minimum(0.55 + abs_flow * 0.2, 0.75),
+        )
+        
+        fire = (up | down) & (np.arange(len(near)) >= 2) & (confidence >= self.min_confidence)
+        signals[near[fire]] = np.where(up[fire], 1, -1)
+        
+        return signals
@@ -11,10 +11,18 @@ Reference: Options theta decay strategies, prediction market time premium
 """
 
 from typing import Optional
-from collections import deque
-import time
+from bisect import bisect_left, insort
+from operator import attrgetter
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 
 from core.base_strategy import BaseStrategy, Signal, MarketData
+from core.ring_buffer import RingBuffer
+
+
+# One C-level call per tick instead of two attribute reads
+_get_time_price = attrgetter('timestamp', 'price')
 
 
 class TimeDecayStrategy(BaseStrategy):
@@ -26,6 +34,14 @@ class TimeDecayStrategy(BaseStrategy):
     and captures the decay as resolution approaches.
     """
     
+    __slots__ = (
+        'window_seconds', 'entry_start', 'entry_end',
+        'stability_threshold', 'stability_window',
+        'min_edge',
+        'price_history', '_price_append', '_window_sorted',
+        'last_window', 'entry_made_this_window',
+    )
+    
     name = "TimeDecay"
     description = "Harvest time premium decay as window approaches expiry"
     
@@ -48,10 +64,25 @@ class TimeDecayStrategy(BaseStrategy):
         self.min_edge = self.config.get('min_edge', 0.02)  # 2%
         
         # Price history for stability calculation
-        self.price_history: deque = deque(maxlen=50)
+        self.price_history = RingBuffer(50)
+        self._price_append = self.price_history.append  # bound once, not per tick
+        
+        # The last stability_window prices kept in sorted order, so the
+        # median is an index lookup instead of a sort per tick
+        self._window_sorted: list = []
         self.last_window = None
         self.entry_made_this_window = False
         
+    def _record_price(self, price: float):
+        """Append price to history and keep the sorted recent window in step."""
+        window_len = min(self.stability_window, self.price_history.maxlen)
+        if len(self.price_history) >= window_len:
+            # Drop the price leaving the stability window
+            evicted = self.price_history[-window_len]
+            del self._window_sorted[bisect_left(self._window_sorted, evicted)]
+        self._price_append(price)
+        insort(self._window_sorted, price)
+    
     def get_time_in_window(self, timestamp: float) -> float:
         """Get progress through current 5-minute window (0.0 to 1.0)."""
         window_start = (int(timestamp) // self.window_seconds) * self.window_seconds
@@ -63,14 +94,14 @@ class TimeDecayStrategy(BaseStrategy):
         if len(self.price_history) < self.stability_window:
             return False
         
-        recent = list(self.price_history)[-self.stability_window:]
-        price_range = max(recent) - min(recent)
-        avg_price = sum(recent) / len(recent)
+        recent = self.price_history.last_n(self.stability_window)
+        price_range = recent.max() - recent.min()
+        avg_price = recent.mean()
         
         if avg_price == 0:
             return False
         
-        return (price_range / avg_price) < self.stability_threshold
+        return bool(price_range / avg_price < self.stability_threshold)
     
     def calculate_fair_value(self) -> float:
         """Estimate fair value based on recent price action."""
@@ -78,23 +109,48 @@ class TimeDecayStrategy(BaseStrategy):
             return 0.5
         
         # Use median of recent prices as fair value estimate
-        recent = list(self.price_history)[-self.stability_window:]
-        sorted_prices = sorted(recent)
+        sorted_prices = self._window_sorted
         mid = len(sorted_prices) // 2
         
         if len(sorted_prices) % 2 == 0:
             return (sorted_prices[mid - 1] + sorted_prices[mid]) / 2
         return sorted_prices[mid]
     
+    def _evaluate_window(self, current_price: float) -> tuple:
+        """
+        Stability, fair value and edge from the sorted window in one pass.
+        
+        Returns: (is_stable, fair_value, edge)
+        """
+        n = len(self.price_history)
+        if n < self.stability_window:
+            return False, 0.5, 0.0
+        
+        window = self._window_sorted
+        avg_price = sum(window) / len(window)
+        if avg_price == 0 or (window[-1] - window[0]) / avg_price >= self.stability_threshold:
+            return False, 0.5, 0.0
+        
+        if n < 5:
+            fair_value = 0.5
+        else:
+            mid = len(window) // 2
+            if len(window) % 2 == 0:
+                fair_value = (window[mid - 1] + window[mid]) / 2
+            else:
+                fair_value = window[mid]
+        
+        return True, fair_value, abs(current_price - fair_value)
+    
     def generate_signal(self, data: MarketData) -> Optional[Signal]:
-        current_time = data.timestamp
-        current_price = data.price
+        current_time, current_price = _get_time_price(data)
         
         # Store price history
-        self.price_history.append(current_price)
+        self._record_price(current_price)
         
         # Check if we're in a new window
         current_window = int(current_time) // self.window_seconds
+        window_start = current_window * self.window_seconds
         if current_window != self.last_window:
             self.last_window = current_window
             self.entry_made_this_window = False
@@ -104,21 +160,17 @@ class TimeDecayStrategy(BaseStrategy):
             return None
         
         # Check timing - must be in entry zone
-        time_progress = self.get_time_in_window(current_time)
+        time_progress = (current_time - window_start) / self.window_seconds
         if not (self.entry_start <= time_progress <= self.entry_end):
             return None
         
-        # Need price stability to establish fair value
-        if not self.is_price_stable():
-            return None
-        
-        # Calculate fair value and edge
-        fair_value = self.calculate_fair_value()
-        
-        # Edge calculation: how far is current price from fair value?
+        # Need price stability to establish fair value, then the edge:
+        # how far is current price from fair value?
         # If price is above fair value, uncertainty is overpriced -> bet on NO
         # If price is below fair value, uncertainty is overpriced -> bet on YES
-        edge = abs(current_price - fair_value)
+        is_stable, fair_value, edge = self._evaluate_window(current_price)
+        if not is_stable:
+            return None
         
         if edge < self.min_edge:
             return None
@@ -150,3 +202,51 @@ class TimeDecayStrategy(BaseStrategy):
                 'time_remaining': time_remaining
             }
         )
+    
+    def generate_signals_batch(self, timestamps, prices) -> np.ndarray:
+        """
+        Vectorized backtest path over full tick arrays.
+        
+        Reproduces generate_signal for a freshly constructed strategy fed
+        the same ticks in order, without touching instance state.
+        Returns an int8 array: 1 = up, -1 = down, 0 = no signal.
+        """
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        prices = np.asarray(prices, dtype=np.float64)
+        n = len(prices)
+        signals = np.zeros(n, dtype=np.int8)
+        window_len = self.stability_window
+        if n < window_len or window_len > self.price_history.maxlen:
+            return signals
+        
+        # Stability and median fair value over each trailing window
+        windows = sliding_window_view(prices, window_len)
+        stable = np.zeros(n, dtype=bool)
+        fair_value = np.full(n, 0.5)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            avg_price = windows.mean(axis=1)
+            price_range = windows.max(axis=1) - windows.min(axis=1)
+            stable[window_len - 1:] = (avg_price != 0) & (price_range / avg_price < self.stability_threshold)
+        fair_value[window_len - 1:] = np.median(windows, axis=1)
+        fair_value[:4] = 0.5  # fewer than 5 prices seen
+        edge = np.abs(prices - fair_value)
+        
+        window_index = timestamps.astype(np.int64) // self.window_seconds
+        time_progress = (timestamps - window_index * self.window_seconds) / self.window_seconds
+        
+        direction = np.where(prices > fair_value, -1, 1)
+        candidate = (
+            stable
+            & (time_progress >= self.entry_start)
+            & (time_progress <= self.entry_end)
+            & (edge >= self.min_edge)
+        )
+        
+        # One entry per window is path dependent, so only candidates are walked
+        last_entry_window = None
+        for i in np.flatnonzero(candidate):
+            if window_index[i] != last_entry_window:
+                signals[i] = direction[i]
+                last_entry_window = window_index[i]
+        
+        return signals
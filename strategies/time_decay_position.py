@@ -9,9 +9,10 @@ Source: navnoorbawa.substack.com - Mathematical Execution Behind Prediction Mark
 """
 
 from typing import Optional, Dict
-import numpy as np
+import math
 import time
 from core.base_strategy import BaseStrategy, Signal, MarketData
+from core.ring_buffer import RingBuffer
 
 
 class TimeDecayPositionStrategy(BaseStrategy):
@@ -24,25 +25,34 @@ class TimeDecayPositionStrategy(BaseStrategy):
     - Reduce position size to manage terminal risk
     """
     
+    __slots__ = ('window_minutes', 'min_position_pct', '_window_seconds', 'price_history')
+    
+    name = "TimeDecayPosition"
+    
     def __init__(self, 
                  window_minutes: float = 5.0,
                  min_position_pct: float = 0.2):
         super().__init__()
-        self.name = "TimeDecayPosition"
         self.window_minutes = window_minutes
         self.min_position_pct = min_position_pct  # Minimum 20% position at end
         
+        # Window length in seconds, fixed for the strategy's lifetime
+        self._window_seconds = window_minutes * 60
+        
+        # Recent prices for the mid-window trend check
+        self.price_history = RingBuffer(20)
+        
     def get_time_remaining_pct(self, data: MarketData) -> float:
         """Get percentage of window remaining."""
         if not data.market_end_time:
             return 1.0
         
-        now = time.time()
-        total_window = self.window_minutes * 60
-        elapsed = now - (data.market_end_time - total_window)
-        remaining = max(0, total_window - elapsed)
+        # total - (now - (end - total)) reduces to end - now
+        remaining = data.market_end_time - time.time()
+        if remaining <= 0:
+            return 0.0
         
-        return remaining / total_window
+        return remaining / self._window_seconds
     
     def generate_signal(self, data: MarketData) -> Optional[Signal]:
         """
@@ -62,12 +72,13 @@ class TimeDecayPositionStrategy(BaseStrategy):
         
         # Calculate position scaling factor
         # Position(t) = Base * √(time_remaining)
-        position_factor = np.sqrt(time_pct)
+        position_factor = math.sqrt(time_pct)
         
         # Early window: full position
         # Late window: reduced position
         if time_pct > 0.8:
             # Early - look for momentum
+            phase = "early"
             if data.vwap and data.price > data.vwap * 1.02:
                 signal_type = "up"
                 confidence = 0.7 * position_factor
@@ -78,10 +89,12 @@ class TimeDecayPositionStrategy(BaseStrategy):
                 return None
         elif time_pct > 0.5:
             # Mid - follow trend
+            phase = "mid"
             if not self.price_history:
                 return None
             
-            price_change = (data.price - self.price_history[-1]) / self.price_history[-1] if self.price_history[-1] > 0 else 0
+            prev_price = self.price_history[-1]
+            price_change = (data.price - prev_price) / prev_price if prev_price > 0 else 0
             
             if price_change > 0.01:
                 signal_type = "up"
@@ -93,6 +106,7 @@ class TimeDecayPositionStrategy(BaseStrategy):
                 return None
         else:
             # Late - only high confidence
+            phase = "late"
             if not data.order_book:
                 return None
             
@@ -104,25 +118,22 @@ class TimeDecayPositionStrategy(BaseStrategy):
             best_bid = data.order_book.get('best_bid', data.price)
             best_ask = data.order_book.get('best_ask', data.price)
             
-            if data.price - best_bid > best_ask - data.price:
-                signal_type = "down"  # Closer to ask, sell
-                confidence = 0.6 * position_factor
-            else:
-                signal_type = "up"  # Closer to bid, buy
-                confidence = 0.6 * position_factor
+            # Closer to ask (above the quote mid) -> sell, else buy
+            signal_type = "down" if data.price > (best_bid + best_ask) * 0.5 else "up"
+            confidence = 0.6 * position_factor
         
         # Update price history
         self.price_history.append(data.price)
-        if len(self.price_history) > 20:
-            self.price_history.pop(0)
         
         if confidence < 0.5:
             return None
         
+        # Reason is only formatted once the signal clears the gate
         return Signal(
             signal=signal_type,
             confidence=confidence,
             strategy=self.name,
+            reason=f"Time decay sizing: {phase} window ({time_pct:.0%} left), position x{position_factor:.2f}",
             metadata={
                 'time_remaining_pct': time_pct,
                 'position_factor': position_factor
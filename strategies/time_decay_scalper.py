@@ -19,11 +19,19 @@ Reference: Black-Scholes for binary options - Gamma ∝ 1/√(T_remaining)
 """
 
 from typing import Optional
-from collections import deque
+from bisect import bisect_left
 import math
-import statistics
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 
 from core.base_strategy import BaseStrategy, Signal, MarketData
+from core.ring_buffer import RingBuffer
+
+
+# Window phases as integer codes, ordered by time remaining
+PHASE_TERMINAL, PHASE_LATE, PHASE_MID, PHASE_EARLY = range(4)
+PHASE_NAMES = ("terminal", "late", "mid", "early")
 
 
 class TimeDecayScalpingStrategy(BaseStrategy):
@@ -40,6 +48,15 @@ class TimeDecayScalpingStrategy(BaseStrategy):
     - Capture the "theta" of the option
     """
     
+    __slots__ = (
+        'early_phase', 'mid_phase', 'late_phase', '_phase_bounds',
+        'uncertainty_zone', 'extreme_zone',
+        '_window_start', '_window_end',
+        'price_history',
+        'last_signal_time', 'cooldown_seconds',
+        'min_edge_bps',
+    )
+    
     name = "TimeDecayScalper"
     description = "Exploits time decay in short-term prediction markets"
     
@@ -52,17 +69,21 @@ class TimeDecayScalpingStrategy(BaseStrategy):
         self.mid_phase = self.config.get('mid_phase', 90)           # 1.5-3 min
         self.late_phase = self.config.get('late_phase', 45)         # <45 sec
         
+        # Phase boundaries in ascending order: the phase code is the number
+        # of boundaries strictly below time remaining
+        self._phase_bounds = (self.late_phase, self.mid_phase, self.early_phase)
+        
         # Price zones
         self.uncertainty_zone = self.config.get('uncertainty_zone', 0.15)  # 0.50 ± 0.15
         self.extreme_zone = self.config.get('extreme_zone', 0.10)          # <0.10 or >0.90
         
-        # Window tracking
-        self.current_window = None
-        self.window_start = None
-        self.window_end = None
+        # Window tracking: only the end is cached, a new window starts
+        # once a tick reaches it
+        self._window_start = None
+        self._window_end = 0.0
         
         # Price history for volatility calc
-        self.price_history = deque(maxlen=20)
+        self.price_history = RingBuffer(20)
         
         # Cooldown
         self.last_signal_time = 0
@@ -73,20 +94,13 @@ class TimeDecayScalpingStrategy(BaseStrategy):
     
     def get_time_to_expiry(self, current_time: float) -> float:
         """Calculate seconds remaining in current window."""
-        if not self.window_end:
+        if not self._window_end:
             return 300  # Default to full window
-        return max(0, self.window_end - current_time)
+        return max(0, self._window_end - current_time)
     
     def get_phase(self, time_remaining: float) -> str:
         """Determine which phase of the window we're in."""
-        if time_remaining > self.early_phase:
-            return "early"
-        elif time_remaining > self.mid_phase:
-            return "mid"
-        elif time_remaining > self.late_phase:
-            return "late"
-        else:
-            return "terminal"
+        return PHASE_NAMES[bisect_left(self._phase_bounds, time_remaining)]
     
     def calculate_gamma(self, price: float, time_remaining: float) -> float:
         """
@@ -129,40 +143,52 @@ class TimeDecayScalpingStrategy(BaseStrategy):
         if len(self.price_history) < 5:
             return 0
         
-        prices = list(self.price_history)
-        try:
-            return statistics.stdev(prices) / statistics.mean(prices) if len(prices) > 1 else 0
-        except:
+        prices = self.price_history.last_n(len(self.price_history))
+        avg = prices.mean()
+        if avg == 0:
             return 0
+        return float(prices.std(ddof=1) / avg)
     
     def generate_signal(self, data: MarketData) -> Optional[Signal]:
         current_time = data.timestamp
         price = data.price
         
+        price_history = self.price_history
+        
         # Update price history
-        self.price_history.append(price)
+        price_history.append(price)
         
-        # Track window
-        window = int(current_time // 300) * 300
-        if window != self.current_window:
-            self.current_window = window
-            self.window_start = window
-            self.window_end = window + 300
+        # Track window (one float compare on the steady-state path)
+        window_end = self._window_end
+        if current_time >= window_end:
+            window_end = (int(current_time // 300) + 1) * 300
+            self._window_end = window_end
+            self._window_start = window_end - 300
         
         # Cooldown check
         if current_time - self.last_signal_time < self.cooldown_seconds:
             return None
         
         # Calculate time metrics
-        time_remaining = self.get_time_to_expiry(current_time)
-        phase = self.get_phase(time_remaining)
+        time_remaining = window_end - current_time  # always in (0, 300]
+        phase = bisect_left(self._phase_bounds, time_remaining)
         
-        # Calculate Greeks
-        gamma = self.calculate_gamma(price, time_remaining)
-        theta = self.calculate_theta(price, time_remaining)
+        # No rule trades the early phase, so skip the greeks and zones
+        if phase == PHASE_EARLY:
+            return None
         
         # Distance from center
         distance_from_center = abs(price - 0.50)
+        
+        # Calculate Greeks (calculate_gamma / calculate_theta inlined so the
+        # center factor and clamped time are computed once)
+        if time_remaining > 0:
+            center_factor = max(0, 0.50 - distance_from_center) / 0.50
+            clamped_time = max(time_remaining, 1)
+            gamma = center_factor * (1 / math.sqrt(clamped_time))
+            theta = center_factor * (1 / clamped_time) * 0.001
+        else:
+            gamma = theta = 0
         in_uncertainty_zone = distance_from_center < self.uncertainty_zone
         in_extreme_zone = price < self.extreme_zone or price > (1 - self.extreme_zone)
         
@@ -171,56 +197,67 @@ class TimeDecayScalpingStrategy(BaseStrategy):
         reason = ""
         
         # TERMINAL PHASE: < 45 seconds remaining
-        if phase == "terminal":
+        if phase == PHASE_TERMINAL:
             if in_uncertainty_zone and gamma > 2.0:
                 # High gamma near expiration - expect rapid moves
                 # Fade the direction of recent momentum
-                if len(self.price_history) >= 5:
-                    recent_prices = list(self.price_history)[-5:]
-                    momentum = recent_prices[-1] - recent_prices[0]
+                if len(price_history) >= 5:
+                    # The newest entry is the current price, so only the
+                    # tick five back is read from the buffer
+                    momentum = price - price_history[-5]
                     
                     if momentum > 0.01:  # Upward momentum
                         # Expect pullback due to high gamma
-                        confidence = min(0.65 + gamma * 0.05, 0.80)
+                        confidence = 0.65 + gamma * 0.05
+                        if confidence > 0.80:
+                            confidence = 0.80
                         signal = "down"
                         reason = f"Terminal fade: momentum {momentum:.3f}, gamma {gamma:.2f}"
                     elif momentum < -0.01:  # Downward momentum
-                        confidence = min(0.65 + gamma * 0.05, 0.80)
+                        confidence = 0.65 + gamma * 0.05
+                        if confidence > 0.80:
+                            confidence = 0.80
                         signal = "up"
                         reason = f"Terminal fade: momentum {momentum:.3f}, gamma {gamma:.2f}"
             
             elif in_extreme_zone and not in_uncertainty_zone:
                 # Near extremes with little time - high probability of settlement
                 if price > 0.90:
-                    confidence = min(0.70 + (price - 0.90) * 2, 0.85)
+                    confidence = 0.70 + (price - 0.90) * 2
+                    if confidence > 0.85:
+                        confidence = 0.85
                     signal = "up"
                     reason = f"Terminal extreme: price {price:.3f}, likely settle YES"
                 elif price < 0.10:
-                    confidence = min(0.70 + (0.10 - price) * 2, 0.85)
+                    confidence = 0.70 + (0.10 - price) * 2
+                    if confidence > 0.85:
+                        confidence = 0.85
                     signal = "down"
                     reason = f"Terminal extreme: price {price:.3f}, likely settle NO"
         
         # LATE PHASE: 45-90 seconds
-        elif phase == "late":
-            if in_uncertainty_zone and gamma > 1.5:
-                # High gamma, reduce exposure
-                volatility = self.calculate_volatility()
+        elif phase == PHASE_LATE:
+            if in_uncertainty_zone and gamma > 1.5 and len(price_history) >= 5:
+                # High gamma, reduce exposure: fade a large 5-tick move. The
+                # move is checked first so the volatility pass only runs on
+                # ticks that could fire
+                first = price_history[-5]
+                if price > first + 0.02:
+                    side = "down"
+                elif price < first - 0.02:
+                    side = "up"
+                else:
+                    side = None
                 
-                if volatility > 0.02:  # High volatility
-                    # Fade the move
-                    if len(self.price_history) >= 5:
-                        recent = list(self.price_history)[-5:]
-                        if recent[-1] > recent[0] + 0.02:
-                            confidence = 0.65
-                            signal = "down"
-                            reason = f"Late phase fade: vol {volatility:.3f}, gamma {gamma:.2f}"
-                        elif recent[-1] < recent[0] - 0.02:
-                            confidence = 0.65
-                            signal = "up"
-                            reason = f"Late phase fade: vol {volatility:.3f}, gamma {gamma:.2f}"
+                if side:
+                    volatility = self.calculate_volatility()
+                    if volatility > 0.02:  # High volatility
+                        confidence = 0.65
+                        signal = side
+                        reason = f"Late phase fade: vol {volatility:.3f}, gamma {gamma:.2f}"
         
         # MID PHASE: 90-180 seconds
-        elif phase == "mid":
+        elif phase == PHASE_MID:
             if in_extreme_zone:
                 # Near extremes with moderate time - capture low theta
                 if price > 0.90:
@@ -243,7 +280,7 @@ class TimeDecayScalpingStrategy(BaseStrategy):
                 metadata={
                     'price': price,
                     'time_remaining': time_remaining,
-                    'phase': phase,
+                    'phase': PHASE_NAMES[phase],
                     'gamma': gamma,
                     'theta': theta,
                     'in_uncertainty_zone': in_uncertainty_zone,
@@ -252,3 +289,86 @@ class TimeDecayScalpingStrategy(BaseStrategy):
             )
         
         return None
+    
+    def generate_signals_batch(self, timestamps, prices) -> np.ndarray:
+        """
+        Vectorized backtest path over full tick arrays.
+        
+        Reproduces generate_signal for a freshly constructed strategy fed
+        the same ticks in order, without touching instance state.
+        Returns an int8 array: 1 = up, -1 = down, 0 = no signal.
+        """
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        prices = np.asarray(prices, dtype=np.float64)
+        n = len(prices)
+        signals = np.zeros(n, dtype=np.int8)
+        if n == 0:
+            return signals
+        
+        history_len = self.price_history.maxlen
+        
+        time_remaining = (timestamps // 300 + 1) * 300 - timestamps
+        phase = np.searchsorted(self._phase_bounds, time_remaining, side='left')
+        
+        distance_from_center = np.abs(prices - 0.50)
+        center_factor = np.maximum(0, 0.50 - distance_from_center) / 0.50
+        gamma = center_factor / np.sqrt(np.maximum(time_remaining, 1))
+        in_uncertainty_zone = distance_from_center < self.uncertainty_zone
+        in_extreme_zone = (prices < self.extreme_zone) | (prices > 1 - self.extreme_zone)
+        
+        # Move over the last five prices, defined once five prices exist
+        has_five = np.arange(n) >= 4
+        first = np.full(n, np.nan)
+        first[4:] = prices[:-4]
+        momentum = prices - first
+        
+        # Coefficient of variation over the (growing) price history, 0
+        # until five prices exist
+        with np.errstate(divide='ignore', invalid='ignore'):
+            padded = np.concatenate((np.full(history_len - 1, np.nan), prices))
+            windows = sliding_window_view(padded, history_len)[4:]
+            volatility = np.zeros(n)
+            volatility[4:] = np.nanstd(windows, axis=1, ddof=1) / np.nanmean(windows, axis=1)
+        
+        direction = np.zeros(n, dtype=np.int8)
+        confidence = np.zeros(n)
+        
+        # Terminal: fade momentum under high gamma, else ride extremes
+        fade = (phase == PHASE_TERMINAL) & in_uncertainty_zone & (gamma > 2.0) & has_five
+        fade_conf = np.minimum(0.65 + gamma * 0.05, 0.80)
+        self._fill(direction, confidence, fade & (momentum > 0.01), -1, fade_conf)
+        self._fill(direction, confidence, fade & (momentum < -0.01), 1, fade_conf)
+        
+        settle = (phase == PHASE_TERMINAL) & in_extreme_zone & ~in_uncertainty_zone
+        self._fill(direction, confidence, settle & (prices > 0.90), 1,
+                   np.minimum(0.70 + (prices - 0.90) * 2, 0.85))
+        self._fill(direction, confidence, settle & (prices < 0.10), -1,
+                   np.minimum(0.70 + (0.10 - prices) * 2, 0.85))
+        
+        # Late: fade large moves in high volatility
+        late = (phase == PHASE_LATE) & in_uncertainty_zone & (gamma > 1.5) & (volatility > 0.02) & has_five
+        self._fill(direction, confidence, late & (prices > first + 0.02), -1, 0.65)
+        self._fill(direction, confidence, late & (prices < first - 0.02), 1, 0.65)
+        
+        # Mid: extremes with moderate time remaining
+        mid = (phase == PHASE_MID) & in_extreme_zone
+        self._fill(direction, confidence, mid & (prices > 0.90), 1, 0.60)
+        self._fill(direction, confidence, mid & (prices < 0.10), -1, 0.60)
+        
+        candidate = (direction != 0) & (confidence >= self.min_confidence)
+        
+        # Cooldown is path dependent, so only the candidate ticks are walked
+        last_signal_time = 0
+        for i in np.flatnonzero(candidate):
+            if timestamps[i] - last_signal_time >= self.cooldown_seconds:
+                signals[i] = direction[i]
+                last_signal_time = timestamps[i]
+        
+        return signals
+    
+    @staticmethod
+    def _fill(direction: np.ndarray, confidence: np.ndarray, mask: np.ndarray,
+              side: int, conf):
+        """Write one branch's direction and confidence into the batch arrays."""
+        direction[mask] = side
+        confidence[mask] = conf[mask] if isinstance(conf, np.ndarray) else conf
@@ -21,7 +21,28 @@ from collections import deque
 from statistics import mean, stdev
 import math
 
+import numpy as np
+
 from core.base_strategy import BaseStrategy, Signal, MarketData
+from core.ring_buffer import RingBuffer
+
+
+def _vpin(buys: List[float], sells: List[float]) -> float:
+    """|Buy - sell| over total volume for aligned bucket windows."""
+    total_volume = sum(abs(b) + abs(s) for b, s in zip(buys, sells))
+    if total_volume == 0:
+        return 0.0
+    return sum(abs(b - s) for b, s in zip(buys, sells)) / total_volume
+
+
+def _flow_imbalance(buys: List[float], sells: List[float]) -> float:
+    """(Buy - sell) / total volume for aligned bucket windows."""
+    total_buy = sum(buys)
+    total_sell = sum(sells)
+    total = total_buy + total_sell
+    if total == 0:
+        return 0.0
+    return (total_buy - total_sell) / total
 
 
 class TimeWeightedMicrostructureStrategy(BaseStrategy):
@@ -37,6 +58,18 @@ class TimeWeightedMicrostructureStrategy(BaseStrategy):
     Trade when VPIN exceeds threshold AND order flow confirms direction.
     """
     
+    __slots__ = (
+        'vpin_buckets', 'vpin_threshold',
+        'flow_window', 'bucket_buy_history', 'bucket_sell_history',
+        'volume_history', 'buy_volume_history', 'sell_volume_history',
+        'price_history',
+        'time_weighted_bid_depth', 'time_weighted_ask_depth',
+        'flow_imbalance_threshold', 'min_volume',
+        'cooldown_periods', 'last_signal_period', 'period_count',
+        'current_bucket_volume', 'bucket_buys', 'bucket_sells', 'bucket_size',
+        '_vpin', '_flow_imbalance',
+    )
+    
     name = "TimeWeightedMicrostructure"
     description = "Time-weighted order book microstructure and VPIN"
     
@@ -50,16 +83,17 @@ class TimeWeightedMicrostructureStrategy(BaseStrategy):
         
         # Order flow tracking
         self.flow_window = self.config.get('flow_window', 20)
-        self.flow_history: deque = deque(maxlen=100)
+        # Completed VPIN buckets, buy and sell volume in parallel buffers
+        self.bucket_buy_history = RingBuffer(100)
+        self.bucket_sell_history = RingBuffer(100)
         
         # Volume tracking
         self.volume_history: deque = deque(maxlen=50)
-        self.buy_volume_history: deque = deque(maxlen=50)
-        self.sell_volume_history: deque = deque(maxlen=50)
+        self.buy_volume_history = RingBuffer(50)
+        self.sell_volume_history = RingBuffer(50)
         
         # Price history
-        self.price_history: deque = deque(maxlen=50)
-        self.microprice_history: deque = deque(maxlen=50)
+        self.price_history = RingBuffer(50)
         
         # Time-weighted metrics
         self.time_weighted_bid_depth: deque = deque(maxlen=30)
@@ -79,6 +113,11 @@ class TimeWeightedMicrostructureStrategy(BaseStrategy):
         self.bucket_buys = 0
         self.bucket_sells = 0
         self.bucket_size = self.config.get('bucket_size', 1000)  # Volume per bucket
+        
+        # VPIN and flow imbalance only change when a bucket completes, so
+        # each is summed once per bucket and cached (None = not yet summed)
+        self._vpin = None
+        self._flow_imbalance = None
     
     def calculate_microprice(self, order_book: Dict) -> Optional[float]:
         """
@@ -119,19 +158,13 @@ class TimeWeightedMicrostructureStrategy(BaseStrategy):
         
         Higher VPIN = more toxic flow (informed trading likely).
         """
-        if len(self.flow_history) < self.vpin_buckets:
-            return 0.0
-        
-        recent_flows = list(self.flow_history)[-self.vpin_buckets:]
-        
-        total_volume = sum(abs(f['buy_vol']) + abs(f['sell_vol']) for f in recent_flows)
-        if total_volume == 0:
+        if len(self.bucket_buy_history) < self.vpin_buckets:
             return 0.0
         
-        imbalance = sum(abs(f['buy_vol'] - f['sell_vol']) for f in recent_flows)
-        
-        vpin = imbalance / total_volume
-        return vpin
+        if self._vpin is None:
+            self._vpin = _vpin(self.bucket_buy_history.last_n(self.vpin_buckets).tolist(),
+                               self.bucket_sell_history.last_n(self.vpin_buckets).tolist())
+        return self._vpin
     
     def calculate_flow_imbalance(self) -> float:
         """
@@ -139,20 +172,24 @@ class TimeWeightedMicrostructureStrategy(BaseStrategy):
         
         Returns value between -1 (all selling) and +1 (all buying).
         """
-        if len(self.flow_history) < self.flow_window:
-            return 0.0
-        
-        recent = list(self.flow_history)[-self.flow_window:]
-        
-        total_buy = sum(f['buy_vol'] for f in recent)
-        total_sell = sum(f['sell_vol'] for f in recent)
-        total = total_buy + total_sell
-        
-        if total == 0:
+        if len(self.bucket_buy_history) < self.flow_window:
             return 0.0
         
-        imbalance = (total_buy - total_sell) / total
-        return imbalance
+        if self._flow_imbalance is None:
+            self._flow_imbalance = _flow_imbalance(self.bucket_buy_history.last_n(self.flow_window).tolist(),
+                                                   self.bucket_sell_history.last_n(self.flow_window).tolist())
+        return self._flow_imbalance
+    
+    def record_bucket(self, buys: float, sells: float):
+        """Append a completed bucket; VPIN and flow are re-summed on next read."""
+        self.bucket_buy_history.append(buys)
+        self.bucket_sell_history.append(sells)
+        
+        # Re-summed from the window rather than rolled with add/subtract:
+        # tick-grid prices put bucket ratios exactly on the thresholds, where
+        # rolling rounding residue would flip the gates
+        self._vpin = None
+        self._flow_imbalance = None
     
     def update_bucket(self, buy_vol: float, sell_vol: float):
         """Update VPIN volume bucket."""
@@ -163,11 +200,7 @@ class TimeWeightedMicrostructureStrategy(BaseStrategy):
         # Check if bucket is full
         if self.current_bucket_volume >= self.bucket_size:
             # Record bucket
-            self.flow_history.append({
-                'buy_vol': self.bucket_buys,
-                'sell_vol': self.bucket_buys,
-                'total': self.current_bucket_volume
-            })
+            self.record_bucket(self.bucket_buys, self.bucket_sells)
             
             # Reset bucket
             self.current_bucket_volume = 0
@@ -178,22 +211,19 @@ class TimeWeightedMicrostructureStrategy(BaseStrategy):
         current_price = data.price
         self.period_count += 1
         
-        # Update price history
-        self.price_history.append(current_price)
+        price_history = self.price_history
         
-        # Calculate microprice
-        microprice = self.calculate_microprice(data.order_book)
-        if microprice:
-            self.microprice_history.append(microprice)
+        # Update price history
+        price_history.append(current_price)
         
         # Estimate buy/sell volume from price movement
         # This is a simplification - real implementation would use trade data
-        if len(self.price_history) >= 2:
-            prev_price = list(self.price_history)[-2]
+        if len(price_history) >= 2:
+            prev_price = price_history[-2]
             price_change = current_price - prev_price
             
             # Estimate volume split based on price direction
-            estimated_volume = data.volume if hasattr(data, 'volume') and data.volume else 100
+            estimated_volume = data.volume or 100
             
             if price_change > 0:
                 buy_vol = estimated_volume * (0.5 + abs(price_change) * 5)
@@ -204,8 +234,10 @@ class TimeWeightedMicrostructureStrategy(BaseStrategy):
             else:
                 buy_vol = sell_vol = estimated_volume / 2
             
-            buy_vol = max(0, buy_vol)
-            sell_vol = max(0, sell_vol)
+            if buy_vol < 0:
+                buy_vol = 0
+            if sell_vol < 0:
+                sell_vol = 0
             
             self.update_bucket(buy_vol, sell_vol)
             self.buy_volume_history.append(buy_vol)
@@ -215,75 +247,152 @@ class TimeWeightedMicrostructureStrategy(BaseStrategy):
         if self.period_count - self.last_signal_period < self.cooldown_periods:
             return None
         
-        # Need enough data
-        if len(self.flow_history) < self.vpin_buckets // 2:
+        # Need a full VPIN window (VPIN reads 0 until then, which never
+        # clears the threshold below)
+        if len(self.bucket_buy_history) < self.vpin_buckets:
             return None
         
-        # Calculate metrics
-        vpin = self.calculate_vpin()
-        flow_imbalance = self.calculate_flow_imbalance()
-        
         # Check VPIN threshold (toxic flow detection)
-        if vpin < self.vpin_threshold:
+        vpin_threshold = self.vpin_threshold
+        vpin = self.calculate_vpin()
+        if vpin < vpin_threshold:
             return None
         
         # Check flow imbalance
-        if abs(flow_imbalance) < self.flow_imbalance_threshold:
+        flow_threshold = self.flow_imbalance_threshold
+        flow_imbalance = self.calculate_flow_imbalance()
+        abs_imbalance = abs(flow_imbalance)
+        if abs_imbalance < flow_threshold:
             return None
         
-        # Generate signal in direction of flow
-        signal = None
-        confidence = 0.0
-        reason = ""
-        metadata = {}
+        # Same confidence model for buy and sell flow
+        base_conf = 0.62
+        vpin_boost = min((vpin - vpin_threshold) * 0.3, 0.12)
+        flow_boost = min((abs_imbalance - flow_threshold) * 0.3, 0.12)
+        
+        confidence = base_conf + vpin_boost + flow_boost
+        if confidence > 0.85:
+            confidence = 0.85
         
+        if confidence < self.min_confidence:
+            return None
+        
+        # Generate signal in direction of flow
         if flow_imbalance > 0:
             # Buy flow dominates
-            base_conf = 0.62
-            vpin_boost = min((vpin - self.vpin_threshold) * 0.3, 0.12)
-            flow_boost = min((flow_imbalance - self.flow_imbalance_threshold) * 0.3, 0.12)
-            
-            confidence = base_conf + vpin_boost + flow_boost
-            confidence = min(confidence, 0.85)
-            
-            if confidence >= self.min_confidence:
-                signal = "up"
-                reason = f"Toxic buy flow: VPIN={vpin:.3f}, imbalance={flow_imbalance:.3f}"
-                metadata = {
-                    'vpin': vpin,
-                    'flow_imbalance': flow_imbalance,
-                    'microprice': microprice,
-                    'price': current_price
-                }
-        
+            signal = "up"
+            reason = f"Toxic buy flow: VPIN={vpin:.3f}, imbalance={flow_imbalance:.3f}"
         else:
             # Sell flow dominates
-            base_conf = 0.62
-            vpin_boost = min((vpin - self.vpin_threshold) * 0.3, 0.12)
-            flow_boost = min((abs(flow_imbalance) - self.flow_imbalance_threshold) * 0.3, 0.12)
-            
-            confidence = base_conf + vpin_boost + flow_boost
-            confidence = min(confidence, 0.85)
-            
-            if confidence >= self.min_confidence:
-                signal = "down"
-                reason = f"Toxic sell flow: VPIN={vpin:.3f}, imbalance={flow_imbalance:.3f}"
-                metadata = {
-                    'vpin': vpin,
-                    'flow_imbalance': flow_imbalance,
-                    'microprice': microprice,
-                    'price': current_price
-                }
-        
-        if signal and confidence >= self.min_confidence:
-            self.last_signal_period = self.period_count
-            
-            return Signal(
-                strategy=self.name,
-                signal=signal,
-                confidence=confidence,
-                reason=reason,
-                metadata=metadata
-            )
-        
-        return None
+            signal = "down"
+            reason = f"Toxic sell flow: VPIN={vpin:.3f}, imbalance={flow_imbalance:.3f}"
+        
+        self.last_signal_period = self.period_count
+        
+        return Signal(
+            strategy=self.name,
+            signal=signal,
+            confidence=confidence,
+            reason=reason,
+            metadata={
+                'vpin': vpin,
+                'flow_imbalance': flow_imbalance,
+                # Microprice only feeds the metadata, so it is computed
+                # once the signal is confirmed
+                'microprice': self.calculate_microprice(data.order_book),
+                'price': current_price
+            }
+        )
+    
+    def generate_signals_batch(self, prices, volumes=None) -> np.ndarray:
+        """
+        Vectorized backtest path over full tick arrays.
+        
+        Reproduces generate_signal for a freshly constructed strategy fed
+        the same ticks in order, without touching instance state.
+        Missing or zero volumes fall back to the same 100 estimate.
+        Returns an int8 array: 1 = up, -1 = down, 0 = no signal.
+        """
+        prices = np.asarray(prices, dtype=np.float64)
+        n = len(prices)
+        signals = np.zeros(n, dtype=np.int8)
+        if n < 2:
+            return signals
+        
+        if volumes is None:
+            estimated_volume = np.full(n - 1, 100.0)
+        else:
+            volumes = np.nan_to_num(np.asarray(volumes, dtype=np.float64)[1:])
+            estimated_volume = np.where(volumes != 0, volumes, 100.0)
+        
+        # Buy/sell split from each price change, as in generate_signal
+        price_change = np.diff(prices)
+        lead = estimated_volume * (0.5 + np.abs(price_change) * 5)
+        half = estimated_volume / 2
+        buy_vol = np.where(price_change > 0, lead, np.where(price_change < 0, estimated_volume - lead, half))
+        sell_vol = np.where(price_change < 0, lead, np.where(price_change > 0, estimated_volume - lead, half))
+        buy_vol = np.maximum(0, buy_vol)
+        sell_vol = np.maximum(0, sell_vol)
+        
+        # Bucket filling resets on every completed bucket, so it is walked
+        # in order; completed[i] counts the buckets closed through tick i
+        bucket_buys = []
+        bucket_sells = []
+        completed = np.zeros(n, dtype=np.int64)
+        bucket_volume = buys = sells = 0
+        bucket_size = self.bucket_size
+        for i, (b, s) in enumerate(zip(buy_vol.tolist(), sell_vol.tolist()), 1):
+            bucket_volume += b + s
+            buys += b
+            sells += s
+            if bucket_volume >= bucket_size:
+                bucket_buys.append(buys)
+                bucket_sells.append(sells)
+                bucket_volume = buys = sells = 0
+            completed[i] = len(bucket_buys)
+        
+        # VPIN and flow imbalance after each completed bucket, summed over the
+        # same windows by the same helpers as generate_signal so threshold
+        # ties resolve identically; entry 0 is "no bucket yet"
+        vpin_buckets = self.vpin_buckets
+        flow_window = self.flow_window
+        maxlen = self.bucket_buy_history.maxlen
+        vpin_by_bucket = [0.0]
+        flow_by_bucket = [0.0]
+        for k in range(1, len(bucket_buys) + 1):
+            held = min(k, maxlen)
+            vpin_by_bucket.append(
+                _vpin(bucket_buys[k - vpin_buckets:k], bucket_sells[k - vpin_buckets:k])
+                if held >= vpin_buckets else 0.0)
+            flow_by_bucket.append(
+                _flow_imbalance(bucket_buys[k - flow_window:k], bucket_sells[k - flow_window:k])
+                if held >= flow_window else 0.0)
+        
+        # The bucket history holds at most maxlen buckets
+        history_len = np.minimum(completed, maxlen)
+        vpin = np.array(vpin_by_bucket)[completed]
+        flow_imbalance = np.array(flow_by_bucket)[completed]
+        
+        abs_imbalance = np.abs(flow_imbalance)
+        confidence = np.minimum(
+            0.62
+            + np.minimum((vpin - self.vpin_threshold) * 0.3, 0.12)
+            + np.minimum((abs_imbalance - self.flow_imbalance_threshold) * 0.3, 0.12),
+            0.85)
+        candidate = (
+            (history_len >= self.vpin_buckets)
+            & (vpin >= self.vpin_threshold)
+            & (abs_imbalance >= self.flow_imbalance_threshold)
+            & (confidence >= self.min_confidence)
+        )
+        direction = np.where(flow_imbalance > 0, 1, -1)
+        
+        # Cooldown is path dependent, so only the candidate ticks are walked
+        last_signal_period = -self.cooldown_periods
+        for i in np.flatnonzero(candidate):
+            period = i + 1
+            if period - last_signal_period >= self.cooldown_periods:
+                signals[i] = direction[i]
+                last_signal_period = period
+        
+        return signals
@@ -13,11 +13,13 @@ Reference: "Intraday Momentum in Prediction Markets" - microstructure research
 """
 
 from typing import Optional, Dict
-from collections import deque
-from statistics import mean
 import time
 
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
 from core.base_strategy import BaseStrategy, Signal, MarketData
+from core.ring_buffer import RingBuffer
 
 
 class TimeWeightedMomentumStrategy(BaseStrategy):
@@ -29,6 +31,15 @@ class TimeWeightedMomentumStrategy(BaseStrategy):
     Later in window = less noise, more signal
     """
     
+    __slots__ = (
+        'window_seconds',
+        'price_history', 'volume_history', 'timestamp_history',
+        'return_history', 'weight_history',
+        'momentum_threshold', 'volume_accel_threshold',
+        'time_weight_exponent', '_weight_exponent_int',
+        'min_points',
+    )
+    
     name = "TimeWeightedMomentum"
     description = "Time-weighted momentum with volume acceleration"
     
@@ -40,9 +51,14 @@ class TimeWeightedMomentumStrategy(BaseStrategy):
         self.window_seconds = self.config.get('window_seconds', 300)  # 5 min
         
         # Momentum calculation
-        self.price_history: deque = deque(maxlen=30)
-        self.volume_history: deque = deque(maxlen=30)
-        self.timestamp_history: deque = deque(maxlen=30)
+        self.price_history = RingBuffer(30)
+        self.volume_history = RingBuffer(30)
+        self.timestamp_history = RingBuffer(30)
+        
+        # Per-tick return and time weight, computed once when the tick
+        # arrives (one entry per consecutive price pair in price_history)
+        self.return_history = RingBuffer(29)
+        self.weight_history = RingBuffer(29)
         
         # Thresholds
         self.momentum_threshold = self.config.get('momentum_threshold', 0.005)  # 0.5%
@@ -51,6 +67,11 @@ class TimeWeightedMomentumStrategy(BaseStrategy):
         # Time weighting (later = higher weight)
         self.time_weight_exponent = self.config.get('time_weight_exponent', 2.0)
         
+        # Integer exponents (the default is 2.0) are applied as multiplies
+        # instead of a float pow
+        exponent = float(self.time_weight_exponent)
+        self._weight_exponent_int = int(exponent) if exponent.is_integer() else None
+        
         # Minimum data points
         self.min_points = 10
         
@@ -65,6 +86,10 @@ class TimeWeightedMomentumStrategy(BaseStrategy):
         progress = elapsed / self.window_seconds
         
         # Apply exponential weighting (later = much higher weight)
+        if self._weight_exponent_int == 2:
+            return progress * progress
+        if self._weight_exponent_int == 3:
+            return progress * progress * progress
         return progress ** self.time_weight_exponent
     
     def calculate_volume_acceleration(self) -> float:
@@ -76,16 +101,14 @@ class TimeWeightedMomentumStrategy(BaseStrategy):
         if len(self.volume_history) < 6:
             return 1.0
         
-        volumes = list(self.volume_history)
-        
-        # Compare recent volume to earlier volume
-        recent_vol = mean(volumes[-3:])
-        earlier_vol = mean(volumes[:3])
-        
-        if earlier_vol == 0:
+        # Compare recent volume to earlier volume (both are three-sample
+        # sums, so the ratio of sums is the ratio of means)
+        volume_history = self.volume_history
+        earlier_sum = volume_history[0] + volume_history[1] + volume_history[2]
+        if earlier_sum == 0:
             return 1.0
         
-        return recent_vol / earlier_vol
+        return (volume_history[-3] + volume_history[-2] + volume_history[-1]) / earlier_sum
     
     def calculate_weighted_momentum(self) -> Optional[float]:
         """
@@ -96,38 +119,38 @@ class TimeWeightedMomentumStrategy(BaseStrategy):
         if len(self.price_history) < self.min_points:
             return None
         
-        prices = list(self.price_history)
-        timestamps = list(self.timestamp_history)
-        
-        # Calculate weighted returns
-        weighted_returns = []
-        total_weight = 0
-        
-        for i in range(1, len(prices)):
-            price_return = (prices[i] - prices[i-1]) / prices[i-1] if prices[i-1] > 0 else 0
-            time_weight = self.calculate_time_weight(timestamps[i])
-            
-            weighted_returns.append(price_return * time_weight)
-            total_weight += time_weight
+        # Weights and returns were memoized on append, so this is only a
+        # dot product over the stored pairs
+        n = len(self.return_history)
+        weights = self.weight_history.last_n(n)
+        total_weight = weights.sum()
         
         if total_weight == 0:
             return 0
         
         # Sum of weighted returns / sum of weights
-        momentum = sum(weighted_returns) / total_weight
+        momentum = float(np.vdot(self.return_history.last_n(n), weights) / total_weight)
         return momentum
     
     def generate_signal(self, market_data: MarketData) -> Optional[Signal]:
         """Generate signal based on time-weighted momentum."""
         current_time = market_data.timestamp
         
+        price = market_data.price
+        time_weight = self.calculate_time_weight(current_time)
+        price_history = self.price_history
+        
         # Update histories
-        self.price_history.append(market_data.price)
+        if price_history:
+            prev_price = price_history[-1]
+            self.return_history.append((price - prev_price) / prev_price if prev_price > 0 else 0)
+            self.weight_history.append(time_weight)
+        price_history.append(price)
         self.volume_history.append(market_data.volume_24h)
         self.timestamp_history.append(current_time)
         
         # Need enough data
-        if len(self.price_history) < self.min_points:
+        if len(price_history) < self.min_points:
             return None
         
         # Calculate metrics
@@ -135,20 +158,25 @@ class TimeWeightedMomentumStrategy(BaseStrategy):
         if momentum is None:
             return None
         
+        # Generate signal when momentum exceeds threshold
+        # AND we have volume confirmation (checked only once momentum passes)
+        abs_momentum = abs(momentum)
+        if abs_momentum <= self.momentum_threshold:
+            return None
+        
         vol_accel = self.calculate_volume_acceleration()
-        time_weight = self.calculate_time_weight(current_time)
         
         # Time remaining in window (0 to 1)
         time_remaining = 1 - time_weight
         
-        # Generate signal when momentum exceeds threshold
-        # AND we have volume confirmation
-        if abs(momentum) > self.momentum_threshold and vol_accel > (1 + self.volume_accel_threshold):
+        if vol_accel > (1 + self.volume_accel_threshold):
             # Strong momentum with volume acceleration
             
             if momentum > 0:
                 # Bullish momentum
-                confidence = min(0.6 + abs(momentum) * 20 + time_weight * 0.2, 0.9)
+                confidence = 0.6 + abs_momentum * 20 + time_weight * 0.2
+                if confidence > 0.9:
+                    confidence = 0.9
                 return Signal(
                     strategy=self.name,
                     signal="up",
@@ -163,7 +191,9 @@ class TimeWeightedMomentumStrategy(BaseStrategy):
                 )
             else:
                 # Bearish momentum
-                confidence = min(0.6 + abs(momentum) * 20 + time_weight * 0.2, 0.9)
+                confidence = 0.6 + abs_momentum * 20 + time_weight * 0.2
+                if confidence > 0.9:
+                    confidence = 0.9
                 return Signal(
                     strategy=self.name,
                     signal="down",
@@ -178,3 +208,54 @@ class TimeWeightedMomentumStrategy(BaseStrategy):
                 )
         
         return None
+    
+    def generate_signals_batch(self, timestamps, prices, volumes) -> np.ndarray:
+        """
+        Vectorized backtest path over full tick arrays.
+        
+        Reproduces generate_signal for a freshly constructed strategy fed
+        the same ticks in order, without touching instance state.
+        Returns an int8 array: 1 = up, -1 = down, 0 = no signal.
+        """
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        prices = np.asarray(prices, dtype=np.float64)
+        volumes = np.asarray(volumes, dtype=np.float64)
+        n = len(prices)
+        signals = np.zeros(n, dtype=np.int8)
+        if n < self.min_points:
+            return signals
+        
+        pairs = self.return_history.maxlen
+        history_len = self.price_history.maxlen
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # Per-tick return and time weight; tick 0 has no pair, so both
+            # are zero there and drop out of the rolling sums
+            returns = np.zeros(n)
+            prev = prices[:-1]
+            returns[1:] = np.where(prev > 0, (prices[1:] - prev) / prev, 0.0)
+            window_start = np.floor(timestamps) // self.window_seconds * self.window_seconds
+            weights = ((timestamps - window_start) / self.window_seconds) ** self.time_weight_exponent
+            weights[0] = 0.0
+            
+            padding = np.zeros(pairs - 1)
+            weighted_sum = sliding_window_view(np.concatenate((padding, returns * weights)), pairs).sum(axis=1)
+            total_weight = sliding_window_view(np.concatenate((padding, weights)), pairs).sum(axis=1)
+            momentum = np.where(total_weight == 0, 0.0, weighted_sum / total_weight)
+            
+            # Sum of the newest three volumes over the oldest three still
+            # in the (growing) volume history, added in the same order as
+            # calculate_volume_acceleration
+            recent_vol = volumes[:-2] + volumes[1:-1] + volumes[2:]
+            earliest = np.maximum(np.arange(n) - (history_len - 1), 0)
+            earlier_vol = recent_vol[earliest]
+            recent_vol = np.concatenate((np.full(2, np.nan), recent_vol))
+            vol_accel = np.where(earlier_vol == 0, 1.0, recent_vol / earlier_vol)
+        
+        fire = (
+            (np.arange(n) >= self.min_points - 1)
+            & (np.abs(momentum) > self.momentum_threshold)
+            & (vol_accel > 1 + self.volume_accel_threshold)
+        )
+        signals[fire] = np.where(momentum[fire] > 0, 1, -1)
+        return signals
@@ -19,10 +19,10 @@ Reference: "Enhancing Trading Strategies with Order Book Signals" - Cartea et al
 """
 
 from typing import Optional
-from collections import deque
-from statistics import mean, stdev
 
 from core.base_strategy import BaseStrategy, Signal, MarketData
+from core.book_view import BookView
+from core.ring_buffer import RingBuffer
 
 
 class ToxicFlowDetectorStrategy(BaseStrategy):
@@ -46,10 +46,9 @@ class ToxicFlowDetectorStrategy(BaseStrategy):
         super().__init__(config)
         config = config or {}
         
-        # Order book history for tracking changes
-        self.ob_history: deque = deque(maxlen=50)
-        self.price_history: deque = deque(maxlen=50)
-        self.volume_history: deque = deque(maxlen=50)
+        # Price and volume history
+        self.price_history = RingBuffer(50)
+        self.volume_history = RingBuffer(50)
         
         # Quote stuffing detection
         self.quote_change_threshold = self.config.get('quote_change_threshold', 5)  # Changes per period
@@ -74,28 +73,25 @@ class ToxicFlowDetectorStrategy(BaseStrategy):
         self.last_signal_period = -self.cooldown_periods
         self.period_count = 0
         
-        # Track last order book state
+        # Track last order book state: top three (price, size) pairs per side
         self.last_bids = None
         self.last_asks = None
         self.quote_changes = 0
         self.periods_since_change = 0
+        
+        # Book imbalance for the current tick, computed on first use
+        self._tick_imbalance = None
     
-    def calculate_book_imbalance(self, data: MarketData) -> float:
+    def calculate_book_imbalance(self, book: Optional[BookView]) -> float:
         """
-        Calculate order book imbalance.
+        Calculate order book imbalance over the top five levels.
         Returns: -1 (all ask) to 1 (all bid)
         """
-        if not data.order_book:
-            return 0
-        
-        bids = data.order_book.get('bids', [])
-        asks = data.order_book.get('asks', [])
-        
-        if not bids or not asks:
+        if book is None or not book.bid_sz or not book.ask_sz:
             return 0
         
-        bid_vol = sum(float(b.get('size', 0)) for b in bids[:5])
-        ask_vol = sum(float(a.get('size', 0)) for a in asks[:5])
+        bid_vol = sum(book.bid_sz)
+        ask_vol = sum(book.ask_sz)
         
         total = bid_vol + ask_vol
         if total == 0:
@@ -103,33 +99,38 @@ class ToxicFlowDetectorStrategy(BaseStrategy):
         
         return (bid_vol - ask_vol) / total
     
-    def detect_quote_stuffing(self, data: MarketData) -> tuple:
+    def _get_imbalance(self, book: Optional[BookView]) -> float:
+        """Book imbalance for the current tick, shared by divergence and metadata."""
+        if self._tick_imbalance is None:
+            self._tick_imbalance = self.calculate_book_imbalance(book)
+        return self._tick_imbalance
+    
+    def detect_quote_stuffing(self, book: Optional[BookView]) -> tuple:
         """
         Detect quote stuffing (rapid order cancellations).
         
         Returns: (is_stuffing, intensity)
         """
-        if not data.order_book:
+        if book is None:
             return False, 0
         
-        bids = data.order_book.get('bids', [])
-        asks = data.order_book.get('asks', [])
+        bid_levels = tuple(zip(book.bid_px[:3], book.bid_sz[:3]))
+        ask_levels = tuple(zip(book.ask_px[:3], book.ask_sz[:3]))
         
-        # Count changes from last state
+        # Count changed levels (price or size) from last state
         changes = 0
         
         if self.last_bids is not None and self.last_asks is not None:
-            # Compare bid levels
-            for i in range(min(3, len(bids), len(self.last_bids))):
-                if (float(bids[i].get('price', 0)) != float(self.last_bids[i].get('price', 0)) or
-                    float(bids[i].get('size', 0)) != float(self.last_bids[i].get('size', 0))):
-                    changes += 1
-            
-            # Compare ask levels
-            for i in range(min(3, len(asks), len(self.last_asks))):
-                if (float(asks[i].get('price', 0)) != float(self.last_asks[i].get('price', 0)) or
-                    float(asks[i].get('size', 0)) != float(self.last_asks[i].get('size', 0))):
-                    changes += 1
+            # An unchanged side is one tuple compare; levels are only walked
+            # when something on that side moved
+            if bid_levels != self.last_bids:
+                for current, last in zip(bid_levels, self.last_bids):
+                    if current != last:
+                        changes += 1
+            if ask_levels != self.last_asks:
+                for current, last in zip(ask_levels, self.last_asks):
+                    if current != last:
+                        changes += 1
         
         # Update tracking
         self.quote_changes += changes
@@ -149,33 +150,32 @@ class ToxicFlowDetectorStrategy(BaseStrategy):
             intensity = 0
         
         # Update last state
-        self.last_bids = bids
-        self.last_asks = asks
+        self.last_bids = bid_levels
+        self.last_asks = ask_levels
         
         return is_stuffing, intensity
     
-    def detect_iceberg(self, data: MarketData) -> tuple:
+    def detect_iceberg(self, book: Optional[BookView]) -> tuple:
         """
         Detect iceberg orders (large hidden volume).
         
         Returns: (is_iceberg, direction, size_ratio)
         """
-        if not data.order_book or len(self.volume_history) < self.iceberg_lookback:
+        if book is None or len(self.volume_history) < self.iceberg_lookback:
             return False, "neutral", 0
         
-        bids = data.order_book.get('bids', [])
-        asks = data.order_book.get('asks', [])
+        bid_sizes = book.bid_sz
+        ask_sizes = book.ask_sz
         
-        if not bids or not asks:
+        if not bid_sizes or not ask_sizes:
             return False, "neutral", 0
         
-        # Calculate average top-of-book volume
-        avg_bid_vol = mean([float(b.get('size', 0)) for b in bids[:1]]) if bids else 0
-        avg_ask_vol = mean([float(a.get('size', 0)) for a in asks[:1]]) if asks else 0
+        # Top-of-book volume
+        avg_bid_vol = bid_sizes[0]
+        avg_ask_vol = ask_sizes[0]
         
-        # Compare to historical average
-        hist_volumes = list(self.volume_history)[-self.iceberg_lookback:]
-        avg_hist_vol = mean(hist_volumes) if hist_volumes else 1
+        # Compare to historical average (window is full past the guard above)
+        avg_hist_vol = float(self.volume_history.last_n(self.iceberg_lookback).sum()) / self.iceberg_lookback
         
         # Check for abnormally large volume on one side
         bid_ratio = avg_bid_vol / avg_hist_vol if avg_hist_vol > 0 else 0
@@ -188,7 +188,7 @@ class ToxicFlowDetectorStrategy(BaseStrategy):
         
         return False, "neutral", 0
     
-    def detect_book_divergence(self, data: MarketData) -> tuple:
+    def detect_book_divergence(self, book: Optional[BookView]) -> tuple:
         """
         Detect divergence between book pressure and price movement.
         
@@ -197,12 +197,15 @@ class ToxicFlowDetectorStrategy(BaseStrategy):
         if len(self.price_history) < 5:
             return False, "neutral", 0
         
-        # Calculate recent price change
-        prices = list(self.price_history)
-        price_change = (prices[-1] - prices[-5]) / prices[-5] if prices[-5] > 0 else 0
+        # Get current book imbalance; a balanced book cannot diverge
+        imbalance = self._get_imbalance(book)
+        if abs(imbalance) <= self.divergence_threshold:
+            return False, "neutral", 0
         
-        # Get current book imbalance
-        imbalance = self.calculate_book_imbalance(data)
+        # Calculate recent price change
+        price_history = self.price_history
+        last_price, past_price = price_history[-1], price_history[-5]
+        price_change = (last_price - past_price) / past_price if past_price > 0 else 0
         
         # Divergence: price moving up but book shows selling pressure (or vice versa)
         # This suggests the price move is artificial/manipulative
@@ -219,50 +222,57 @@ class ToxicFlowDetectorStrategy(BaseStrategy):
         
         return False, "neutral", 0
     
-    def calculate_toxicity_score(self, data: MarketData) -> tuple:
+    def calculate_toxicity_score(self, book: Optional[BookView]) -> tuple:
         """
         Calculate overall toxicity score.
         
         Returns: (score, primary_direction, indicators)
         """
+        # Run all three detectors (quote stuffing keeps per-tick state)
+        is_stuffing, stuffing_intensity = self.detect_quote_stuffing(book)
+        is_iceberg, iceberg_dir, iceberg_ratio = self.detect_iceberg(book)
+        is_divergence, div_dir, div_strength = self.detect_book_divergence(book)
+        
         score = 0
-        indicators = []
         direction = "neutral"
         
-        # Check quote stuffing
-        is_stuffing, stuffing_intensity = self.detect_quote_stuffing(data)
         if is_stuffing:
             score += 1
-            indicators.append(f"stuffing({stuffing_intensity:.1f})")
         
-        # Check iceberg
-        is_iceberg, iceberg_dir, iceberg_ratio = self.detect_iceberg(data)
         if is_iceberg:
             score += 1.5
-            indicators.append(f"iceberg({iceberg_dir},{iceberg_ratio:.1f})")
             direction = iceberg_dir
         
-        # Check divergence
-        is_divergence, div_dir, div_strength = self.detect_book_divergence(data)
         if is_divergence:
             score += 1.5
-            indicators.append(f"divergence({div_dir},{div_strength:.1f})")
             # Divergence direction is what we're fading
             if div_dir == "toxic_buying":
                 direction = "selling"  # Fade the toxic buying
             elif div_dir == "toxic_selling":
                 direction = "buying"  # Fade the toxic selling
         
+        # Indicator labels are only formatted once the score can signal
+        if score < self.min_toxicity_score:
+            return score, direction, []
+        
+        indicators = []
+        if is_stuffing:
+            indicators.append(f"stuffing({stuffing_intensity:.1f})")
+        if is_iceberg:
+            indicators.append(f"iceberg({iceberg_dir},{iceberg_ratio:.1f})")
+        if is_divergence:
+            indicators.append(f"divergence({div_dir},{div_strength:.1f})")
+        
         return score, direction, indicators
     
     def generate_signal(self, data: MarketData) -> Optional[Signal]:
         current_price = data.price
         self.period_count += 1
+        self._tick_imbalance = None
         
         # Update history
         self.price_history.append(current_price)
         self.volume_history.append(data.volume_24h)
-        self.ob_history.append(data.order_book)
         
         # Check cooldown
         if self.period_count - self.last_signal_period < self.cooldown_periods:
@@ -272,8 +282,12 @@ class ToxicFlowDetectorStrategy(BaseStrategy):
         if len(self.price_history) < 10:
             return None
         
-        # Calculate toxicity
-        toxicity_score, toxic_direction, indicators = self.calculate_toxicity_score(data)
+        # Calculate toxicity (the top of the book is parsed once per tick
+        # and shared by every detector)
+        book = data.book()
+        if book is None:
+            return None  # no detector can fire (or keeps state) without a book
+        toxicity_score, toxic_direction, indicators = self.calculate_toxicity_score(book)
         
         # Need sufficient toxicity
         if toxicity_score < self.min_toxicity_score:
@@ -314,7 +328,7 @@ class ToxicFlowDetectorStrategy(BaseStrategy):
                     'toxicity_score': toxicity_score,
                     'toxic_direction': toxic_direction,
                     'indicators': indicators,
-                    'book_imbalance': self.calculate_book_imbalance(data)
+                    'book_imbalance': self._get_imbalance(book)
                 }
             )
         
@@ -25,10 +25,25 @@ Validation:
 
 from typing import Optional
 from collections import deque
-import statistics
+import math
 import time
 
 from core.base_strategy import BaseStrategy, Signal, MarketData
+from core.book_view import BookView
+from core.ring_buffer import RingBuffer
+
+
+def _mean_cv(values) -> tuple:
+    """
+    Mean and coefficient of variation (sample stdev / mean) of at least
+    two values. The CV is reported as 1.0 (fully irregular) for a zero mean.
+    """
+    n = len(values)
+    avg = sum(values) / n
+    if avg == 0:
+        return 0.0, 1.0
+    variance = sum((v - avg) ** 2 for v in values) / (n - 1)
+    return avg, math.sqrt(variance) / avg
 
 
 class TWAPDetectorStrategy(BaseStrategy):
@@ -58,8 +73,10 @@ class TWAPDetectorStrategy(BaseStrategy):
         
         # Trade pattern detection
         self.trade_history = deque(maxlen=50)
-        self.volume_history = deque(maxlen=30)
-        self.time_history = deque(maxlen=30)
+        self.volume_history = RingBuffer(30)
+        self.time_history = RingBuffer(30)
+        # Gaps between consecutive entries of time_history, appended with it
+        self.interval_history = RingBuffer(29)
         
         # TWAP detection parameters
         self.min_trades_for_pattern = self.config.get('min_trades_for_pattern', 5)
@@ -67,8 +84,8 @@ class TWAPDetectorStrategy(BaseStrategy):
         self.size_consistency_threshold = self.config.get('size_consistency_threshold', 0.6)  # 60% similar sizes
         
         # Direction detection
-        self.pressure_history = deque(maxlen=20)
-        self.price_history = deque(maxlen=30)
+        self.pressure_history = RingBuffer(20)
+        self.price_history = RingBuffer(30)
         
         # TWAP state
         self.twap_detected = False
@@ -90,6 +107,10 @@ class TWAPDetectorStrategy(BaseStrategy):
         # Minimum volume for detection
         self.min_volume = self.config.get('min_volume', 2000)
         self.min_trade_size = self.config.get('min_trade_size', 100)
+        
+        # Config-derived constants used every tick
+        self._max_cv_interval = 1 - self.regularity_threshold
+        self._max_cv_size = 1 - self.size_consistency_threshold
     
     def detect_trade_regularity(self) -> tuple:
         """
@@ -101,29 +122,18 @@ class TWAPDetectorStrategy(BaseStrategy):
         if len(self.time_history) < self.min_trades_for_pattern:
             return False, 0, 1.0
         
-        times = list(self.time_history)
-        if len(times) < 2:
-            return False, 0, 1.0
-        
-        # Calculate intervals between trades
-        intervals = [times[i] - times[i-1] for i in range(1, len(times))]
-        
+        # Intervals between trades are recorded as timestamps arrive
+        intervals = self.interval_history
         if len(intervals) < 3:
             return False, 0, 1.0
         
-        avg_interval = statistics.mean(intervals)
+        avg_interval, cv_interval = _mean_cv(list(intervals))
         
         if avg_interval == 0:
             return False, 0, 1.0
         
-        try:
-            std_interval = statistics.stdev(intervals)
-            cv_interval = std_interval / avg_interval
-        except:
-            return False, avg_interval, 1.0
-        
         # Low CV indicates regular timing
-        is_regular = cv_interval < (1 - self.regularity_threshold)
+        is_regular = cv_interval < self._max_cv_interval
         
         return is_regular, avg_interval, cv_interval
     
@@ -136,43 +146,31 @@ class TWAPDetectorStrategy(BaseStrategy):
         if len(self.volume_history) < self.min_trades_for_pattern:
             return False, 0, 1.0
         
-        volumes = list(self.volume_history)
+        volumes = self.volume_history
         if len(volumes) < 3:
             return False, 0, 1.0
         
-        avg_size = statistics.mean(volumes)
+        avg_size, cv_size = _mean_cv(list(volumes))
         
         if avg_size == 0:
             return False, 0, 1.0
         
-        try:
-            std_size = statistics.stdev(volumes)
-            cv_size = std_size / avg_size
-        except:
-            return False, avg_size, 1.0
-        
         # Low CV indicates consistent sizes
-        is_consistent = cv_size < (1 - self.size_consistency_threshold)
+        is_consistent = cv_size < self._max_cv_size
         
         return is_consistent, avg_size, cv_size
     
-    def calculate_buy_pressure(self, data: MarketData) -> float:
+    def calculate_buy_pressure(self, book: Optional[BookView]) -> float:
         """
         Calculate buy/sell pressure from order book and price action.
         Returns: +1.0 = strong buy pressure, -1.0 = strong sell pressure
         """
-        if not data.order_book:
+        if book is None or not book.bid_sz or not book.ask_sz:
             return 0.0
         
-        bids = data.order_book.get('bids', [])
-        asks = data.order_book.get('asks', [])
-        
-        if not bids or not asks:
-            return 0.0
-        
-        # Calculate depth imbalance
-        bid_vol = sum(float(b.get('size', 0)) for b in bids[:5])
-        ask_vol = sum(float(a.get('size', 0)) for a in asks[:5])
+        # Calculate depth imbalance over the top five levels
+        bid_vol = sum(book.bid_sz)
+        ask_vol = sum(book.ask_sz)
         total_vol = bid_vol + ask_vol
         
         if total_vol == 0:
@@ -183,25 +181,32 @@ class TWAPDetectorStrategy(BaseStrategy):
         
         # Price momentum
         if len(self.price_history) >= 5:
-            prices = list(self.price_history)
-            recent_change = (prices[-1] - prices[-5]) / prices[-5] if prices[-5] > 0 else 0
-            momentum = max(-1, min(1, recent_change * 100))  # Scale to [-1, 1]
+            price_history = self.price_history
+            last_price, past_price = price_history[-1], price_history[-5]
+            recent_change = (last_price - past_price) / past_price if past_price > 0 else 0
+            momentum = recent_change * 100  # Scale to [-1, 1]
+            if momentum > 1:
+                momentum = 1
+            elif momentum < -1:
+                momentum = -1
         else:
             momentum = 0.0
         
         # Combine signals
         pressure = depth_imbalance * 0.6 + momentum * 0.4
         
-        return max(-1, min(1, pressure))
+        if pressure > 1:
+            return 1
+        if pressure < -1:
+            return -1
+        return pressure
     
-    def detect_twap_pattern(self, data: MarketData) -> tuple:
+    def detect_twap_pattern(self, book: Optional[BookView]) -> tuple:
         """
         Detect if a TWAP order is currently executing.
         
-        Returns: (is_twap, direction, strength, confidence)
+        Returns: (is_twap, direction, strength, confidence, avg_pressure)
         """
-        current_time = data.timestamp
-        
         # Check regularity
         is_regular, avg_interval, cv_interval = self.detect_trade_regularity()
         
@@ -209,23 +214,22 @@ class TWAPDetectorStrategy(BaseStrategy):
         is_consistent, avg_size, cv_size = self.detect_size_consistency()
         
         # Check pressure
-        pressure = self.calculate_buy_pressure(data)
+        pressure = self.calculate_buy_pressure(book)
         self.pressure_history.append(pressure)
         
         # Need both regularity and consistency
         if not (is_regular and is_consistent):
-            return False, "none", 0.0, 0.0
+            return False, "none", 0.0, 0.0, 0.0
         
         # Need sustained pressure
         if len(self.pressure_history) < 5:
-            return False, "none", 0.0, 0.0
+            return False, "none", 0.0, 0.0, 0.0
         
-        recent_pressure = list(self.pressure_history)[-5:]
-        avg_pressure = statistics.mean(recent_pressure)
+        avg_pressure = float(self.pressure_history.last_n(5).mean())
         
         # Pressure must be consistently in one direction
         if abs(avg_pressure) < 0.3:
-            return False, "none", 0.0, 0.0
+            return False, "none", 0.0, 0.0, 0.0
         
         # Determine direction from pressure
         direction = "up" if avg_pressure > 0 else "down"
@@ -240,26 +244,28 @@ class TWAPDetectorStrategy(BaseStrategy):
         # Calculate confidence
         confidence = 0.55 + strength * 0.25
         
-        return True, direction, strength, confidence
+        return True, direction, strength, confidence, avg_pressure
     
     def generate_signal(self, data: MarketData) -> Optional[Signal]:
         current_time = data.timestamp
         
         # Update history
         self.price_history.append(data.price)
+        if self.time_history:
+            self.interval_history.append(current_time - self.time_history[-1])
         self.time_history.append(current_time)
         
+        # Parse the top of the book once; shared by the volume estimate
+        # and the pressure calculation
+        book = data.book()
+        
         # Estimate volume from order book changes
-        if data.order_book:
-            bids = data.order_book.get('bids', [])
-            asks = data.order_book.get('asks', [])
-            if bids and asks:
-                est_volume = sum(float(b.get('size', 0)) for b in bids[:3]) + \
-                            sum(float(a.get('size', 0)) for a in asks[:3])
-                self.volume_history.append(est_volume)
+        if book is not None and book.bid_sz and book.ask_sz:
+            est_volume = sum(book.bid_sz[:3]) + sum(book.ask_sz[:3])
+            self.volume_history.append(est_volume)
         
         # Detect TWAP pattern
-        is_twap, direction, strength, confidence = self.detect_twap_pattern(data)
+        is_twap, direction, strength, confidence, avg_pressure = self.detect_twap_pattern(book)
         
         # Update TWAP state
         if is_twap and not self.twap_detected:
@@ -279,7 +285,8 @@ class TWAPDetectorStrategy(BaseStrategy):
                 self.twap_direction = None
                 self.last_exit_time = current_time
         
-        # Check if we should exit existing position
+        # Check if we should exit existing position; progress is reused by
+        # the entry check below, which only runs while a TWAP is active
         if self.twap_detected:
             elapsed = current_time - self.twap_start_time
             progress = elapsed / self.max_twap_duration
@@ -297,9 +304,6 @@ class TWAPDetectorStrategy(BaseStrategy):
         # Generate entry signal when TWAP is detected
         if is_twap and self.twap_detected:
             # Only enter if we're early in the TWAP
-            elapsed = current_time - self.twap_start_time
-            progress = elapsed / self.max_twap_duration
-            
             if progress < self.exit_before_completion:
                 # Calculate final confidence
                 time_boost = (1 - progress) * 0.1  # Higher confidence early
@@ -319,7 +323,7 @@ class TWAPDetectorStrategy(BaseStrategy):
                             'progress': progress,
                             'elapsed': elapsed,
                             'regularity_cv': 1 - strength,
-                            'pressure': statistics.mean(list(self.pressure_history)[-5:]) if self.pressure_history else 0
+                            'pressure': avg_pressure
                         }
                     )
         
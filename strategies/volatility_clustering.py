@@ -18,10 +18,10 @@ Validation:
 """
 
 import time
-import numpy as np
-from typing import Optional, Dict, List
-from collections import deque
+from typing import Optional, Dict
 from core.base_strategy import BaseStrategy, Signal, MarketData
+from core.ring_buffer import RingBuffer
+from core.rolling_stats import RollingVar
 
 
 class VolatilityClusteringStrategy(BaseStrategy):
@@ -55,25 +55,15 @@ class VolatilityClusteringStrategy(BaseStrategy):
         self.cooldown_seconds = 60  # One trade per minute max
         
         # State
-        self.price_history: deque = deque(maxlen=self.return_history_len + 10)
-        self.returns: deque = deque(maxlen=self.return_history_len)
-        self.volatility_history: deque = deque(maxlen=self.return_history_len)
+        self.price_history = RingBuffer(self.return_history_len + 10)
+        self.returns = RingBuffer(self.return_history_len)
+        self.volatility_history = RingBuffer(self.return_history_len)
+        # Rolling return variance per window, updated as each return arrives
+        self.short_rv = RollingVar(self.short_window)
+        self.long_rv = RollingVar(self.long_window)
         self.last_signal_time = 0
         self.last_regime = 'normal'  # 'low', 'normal', 'high'
         
-    def _calculate_realized_volatility(self, returns: List[float], window: int) -> float:
-        """Calculate annualized realized volatility."""
-        if len(returns) < window:
-            return 0.0
-        
-        recent_returns = list(returns)[-window:]
-        # Annualized volatility (assuming 5-min bars, 288 bars/day, 252 trading days)
-        # For 5-min: sqrt(288 * 252) ≈ 269.5
-        ann_factor = 269.5
-        
-        vol = np.std(recent_returns) * ann_factor
-        return vol
-    
     def _detect_volatility_regime(self, short_vol: float, long_vol: float) -> str:
         """Detect current volatility regime."""
         if long_vol == 0:
@@ -104,17 +94,20 @@ class VolatilityClusteringStrategy(BaseStrategy):
             return None
         
         # Calculate return
-        prices = list(self.price_history)
-        ret = (prices[-1] - prices[-2]) / prices[-2] if prices[-2] != 0 else 0
+        last_price, prev_price = self.price_history[-1], self.price_history[-2]
+        ret = (last_price - prev_price) / prev_price if prev_price != 0 else 0
         self.returns.append(ret)
+        self.short_rv.push(ret)
+        self.long_rv.push(ret)
         
         # Need enough returns
         if len(self.returns) < self.long_window:
             return None
         
-        # Calculate volatilities
-        short_vol = self._calculate_realized_volatility(list(self.returns), self.short_window)
-        long_vol = self._calculate_realized_volatility(list(self.returns), self.long_window)
+        # Annualized realized volatilities (assuming 5-min bars, 288 bars/day,
+        # 252 trading days): sqrt(288 * 252) ≈ 269.5
+        short_vol = self.short_rv.std() * 269.5
+        long_vol = self.long_rv.std() * 269.5
         
         self.volatility_history.append(short_vol)
         
@@ -129,8 +122,7 @@ class VolatilityClusteringStrategy(BaseStrategy):
         # Transition: Compression -> Expansion (breakout coming)
         if self.last_regime == 'low' and current_regime == 'high':
             # Volatility is expanding - trade in direction of recent move
-            recent_returns = list(self.returns)[-5:]
-            avg_return = np.mean(recent_returns)
+            avg_return = self.returns.last_n(5).mean()
             
             if abs(avg_return) > 0.001:  # Need some directional bias
                 direction = 'up' if avg_return > 0 else 'down'
@@ -140,8 +132,7 @@ class VolatilityClusteringStrategy(BaseStrategy):
         
         # Transition: Normal -> High (momentum continuation)
         elif self.last_regime == 'normal' and current_regime == 'high':
-            recent_returns = list(self.returns)[-3:]
-            avg_return = np.mean(recent_returns)
+            avg_return = self.returns.last_n(3).mean()
             
             if abs(avg_return) > 0.0005:
                 direction = 'up' if avg_return > 0 else 'down'
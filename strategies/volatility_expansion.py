@@ -12,10 +12,9 @@ Reference: Bollinger Band Width (BBW) momentum
 """
 
 from typing import Optional
-from collections import deque
-from statistics import mean, stdev
 
 from core.base_strategy import BaseStrategy, Signal, MarketData
+from core.ring_buffer import RingBuffer
 
 
 class VolatilityExpansionStrategy(BaseStrategy):
@@ -36,10 +35,10 @@ class VolatilityExpansionStrategy(BaseStrategy):
         config = config or {}
         
         # Price history for Bollinger Bands
-        self.price_history: deque = deque(maxlen=50)
+        self.price_history = RingBuffer(50)
         
         # BBW history
-        self.bbw_history: deque = deque(maxlen=30)
+        self.bbw_history = RingBuffer(30)
         
         # Bollinger Band parameters
         self.bb_period = self.config.get('bb_period', 20)
@@ -65,14 +64,15 @@ class VolatilityExpansionStrategy(BaseStrategy):
         self.compression_periods = 0
         self.in_compression = False
     
-    def calculate_bollinger_bands(self, prices: list) -> tuple:
+    def calculate_bollinger_bands(self, prices: RingBuffer) -> tuple:
         """Calculate Bollinger Bands."""
         if len(prices) < self.bb_period:
             return None, None, None
         
-        recent = list(prices)[-self.bb_period:]
-        sma = mean(recent)
-        std_dev = stdev(recent) if len(recent) > 1 else 0
+        # Reductions run on a view of the ring buffer, no list copy
+        recent = prices.last_n(self.bb_period)
+        sma = float(recent.mean())
+        std_dev = float(recent.std(ddof=1)) if len(recent) > 1 else 0
         
         upper = sma + (self.bb_std * std_dev)
         lower = sma - (self.bb_std * std_dev)
@@ -90,15 +90,15 @@ class VolatilityExpansionStrategy(BaseStrategy):
         if len(self.price_history) < 5:
             return 0
         
-        prices = list(self.price_history)
+        prices = self.price_history.last_n(8)
         recent = prices[-3:]
-        earlier = prices[-8:-3]
+        earlier = prices[:-3]
         
-        if not earlier:
+        if not len(earlier):
             return 0
         
-        recent_avg = mean(recent)
-        earlier_avg = mean(earlier)
+        recent_avg = float(recent.mean())
+        earlier_avg = float(earlier.mean())
         
         if earlier_avg == 0:
             return 0
@@ -134,9 +134,8 @@ class VolatilityExpansionStrategy(BaseStrategy):
             return None
         
         # Get recent BBW values
-        bbw_list = list(self.bbw_history)
-        recent_bbw = bbw_list[-1]
-        avg_bbw = mean(bbw_list[-self.min_compression_periods:])
+        recent_bbw = self.bbw_history[-1]
+        avg_bbw = float(self.bbw_history.last_n(self.min_compression_periods).mean())
         
         # Detect compression (low volatility period)
         is_compressed = recent_bbw < avg_bbw * 0.8 and recent_bbw < self.compression_threshold
@@ -7,12 +7,14 @@ Targets low-volatility markets with high liquidity rewards.
 Reference: defiance_cr interview, Poly-Maker bot
 """
 
-from typing import Optional, Dict, List
-from collections import deque
-from statistics import mean, stdev
+from typing import Optional, Dict
 import math
 
+import numpy as np
+
 from core.base_strategy import BaseStrategy, Signal, MarketData
+from core.ring_buffer import RingBuffer
+from core.rolling_stats import RollingVar
 
 
 class VolatilityScorerStrategy(BaseStrategy):
@@ -50,39 +52,36 @@ class VolatilityScorerStrategy(BaseStrategy):
         self.max_volatility = self.config.get('max_volatility', 0.05)  # 5%
         
         # Price history for each timeframe
-        self.price_history = deque(maxlen=max(self.timeframes.values()))
+        self.price_history = RingBuffer(max(self.timeframes.values()))
+        
+        # Rolling mean/variance per timeframe, updated as each price arrives
+        self.timeframe_stats = {name: RollingVar(window) for name, window in self.timeframes.items()}
         
-    def calculate_volatility(self, prices: List[float]) -> float:
+    def calculate_volatility(self, stats: RollingVar) -> float:
         """
-        Calculate volatility as coefficient of variation.
+        Calculate volatility as coefficient of variation over a full window.
         
         Returns:
             Volatility score (0 = no movement, higher = more volatile)
         """
-        if len(prices) < 2:
+        if len(stats) < stats.window or len(stats) < 2:
             return float('inf')  # Not enough data
         
-        avg = mean(prices)
-        if avg == 0:
+        if stats.mean == 0:
             return float('inf')
         
-        try:
-            std = stdev(prices)
-            cv = std / avg  # Coefficient of variation
-            return cv
-        except:
-            return float('inf')
+        return stats.std(ddof=1) / stats.mean  # Coefficient of variation
     
-    def calculate_price_range(self, prices: List[float]) -> float:
+    def calculate_price_range(self, prices: np.ndarray) -> float:
         """Calculate price range as percentage of mean."""
         if len(prices) < 2:
             return 1.0  # Max uncertainty
         
-        avg = mean(prices)
+        avg = float(np.mean(prices))
         if avg == 0:
             return 1.0
         
-        price_range = (max(prices) - min(prices)) / avg
+        price_range = float(np.max(prices) - np.min(prices)) / avg
         return price_range
     
     def score_market(self, market_data: MarketData) -> Optional[Dict]:
@@ -95,16 +94,15 @@ class VolatilityScorerStrategy(BaseStrategy):
         if len(self.price_history) < self.timeframes['short']:
             return None
         
-        prices = list(self.price_history)
+        price_history = self.price_history
+        n_prices = len(price_history)
         
-        # Calculate volatility for each timeframe
-        volatilities = {}
-        for name, window in self.timeframes.items():
-            if len(prices) >= window:
-                recent_prices = prices[-window:]
-                volatilities[name] = self.calculate_volatility(recent_prices)
-            else:
-                volatilities[name] = float('inf')
+        # Volatility (coefficient of variation) for each timeframe, read
+        # from the rolling stats instead of rescanning the window
+        volatilities = {
+            name: self.calculate_volatility(stats)
+            for name, stats in self.timeframe_stats.items()
+        }
         
         # Check if any volatility is too high
         for name, vol in volatilities.items():
@@ -135,8 +133,9 @@ class VolatilityScorerStrategy(BaseStrategy):
             score = estimated_reward / weighted_vol
         
         # Calculate price trend
-        if len(prices) >= 2:
-            price_change = (prices[-1] - prices[0]) / prices[0] if prices[0] > 0 else 0
+        if n_prices >= 2:
+            first_price, last_price = price_history[0], price_history[-1]
+            price_change = (last_price - first_price) / first_price if first_price > 0 else 0
         else:
             price_change = 0
         
@@ -152,7 +151,10 @@ class VolatilityScorerStrategy(BaseStrategy):
     def generate_signal(self, market_data: MarketData) -> Optional[Signal]:
         """Generate signal if market passes volatility screening."""
         # Update price history
-        self.price_history.append(market_data.price)
+        price = market_data.price
+        self.price_history.append(price)
+        for stats in self.timeframe_stats.values():
+            stats.push(price)
         
         # Score the market
         score_data = self.score_market(market_data)
@@ -0,0 +1,133 @@
+"""
+Scalar vs batch equivalence for the vectorized backtest paths.
+
+Each generate_signals_batch must reproduce generate_signal tick for tick
+on a freshly constructed strategy. Prices move on the 0.01 tick grid so
+window ratios land exactly on thresholds, where differently rounded sums
+would disagree.
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from core.base_strategy import MarketData
+from strategies.spread_capture import SpreadCaptureStrategy
+from strategies.tick_size_arbitrage import TickSizeArbitrageStrategy
+from strategies.time_weighted_microstructure import TimeWeightedMicrostructureStrategy
+from strategies.time_weighted_momentum import TimeWeightedMomentumStrategy
+
+
+def tick_grid_prices(seed: int, n: int = 4000) -> list:
+    rng = random.Random(seed)
+    price = 0.5
+    prices = []
+    for _ in range(n):
+        price = min(0.99, max(0.01, round(price + rng.choice((-0.01, 0.0, 0.0, 0.01)), 2)))
+        prices.append(price)
+    return prices
+
+
+def scalar_signals(strategy, ticks) -> np.ndarray:
+    out = []
+    for data in ticks:
+        signal = strategy.generate_signal(data)
+        out.append(0 if signal is None else (1 if signal.signal == 'up' else -1))
+    return np.array(out, dtype=np.int8)
+
+
+def make_tick(timestamp: float, price: float, volume_24h: float = 1e5, **fields) -> MarketData:
+    return MarketData(
+        timestamp=float(timestamp), asset='BTC', price=price, bid=price - 0.01, ask=price + 0.01,
+        mid=price, vwap=price, spread_bps=200.0, volume_24h=volume_24h, **fields,
+    )
+
+
+@pytest.mark.parametrize('config', [
+    {'bucket_size': 50, 'vpin_buckets': 5, 'flow_imbalance_threshold': 0.01, 'vpin_threshold': 0.05},
+    {'bucket_size': 50, 'vpin_buckets': 5, 'flow_imbalance_threshold': 0.01, 'vpin_threshold': 0.05,
+     'cooldown_periods': 1},
+    {'bucket_size': 50, 'vpin_buckets': 5, 'flow_imbalance_threshold': 0.0, 'vpin_threshold': 0.0},
+    {'bucket_size': 300, 'vpin_buckets': 10, 'flow_window': 7, 'flow_imbalance_threshold': 0.01,
+     'vpin_threshold': 0.02, 'cooldown_periods': 1},
+])
+@pytest.mark.parametrize('seed', [1, 2, 3])
+def test_time_weighted_microstructure_batch_matches_scalar(config, seed):
+    prices = tick_grid_prices(seed)
+    ticks = [make_tick(i, p) for i, p in enumerate(prices)]
+
+    expected = scalar_signals(TimeWeightedMicrostructureStrategy(config), ticks)
+    actual = TimeWeightedMicrostructureStrategy(config).generate_signals_batch(prices)
+
+    assert expected.any()
+    np.testing.assert_array_equal(actual, expected)
+
+
+@pytest.mark.parametrize('config', [{}, {'tick_proximity': 0.01, 'flow_lookback': 9}])
+@pytest.mark.parametrize('seed', [1, 2])
+def test_tick_size_arbitrage_batch_matches_scalar(config, seed):
+    rng = random.Random(seed)
+    ticks, bid_volumes, ask_volumes = [], [], []
+    for i in range(4000):
+        price = rng.uniform(0.01, 0.99)
+        bids = [{'price': price - 0.01 * k, 'size': rng.choice((10, 20, 50, 100))} for k in range(1, 4)]
+        asks = [{'price': price + 0.01 * k, 'size': rng.choice((10, 20, 50, 100))} for k in range(1, 4)]
+        ticks.append(make_tick(i, price, order_book={'bids': bids, 'asks': asks}))
+        bid_volumes.append(float(sum(b['size'] for b in bids)))
+        ask_volumes.append(float(sum(a['size'] for a in asks)))
+
+    expected = scalar_signals(TickSizeArbitrageStrategy(config), ticks)
+    actual = TickSizeArbitrageStrategy(config).generate_signals_batch(
+        [t.price for t in ticks], bid_volumes, ask_volumes)
+
+    assert expected.any()
+    np.testing.assert_array_equal(actual, expected)
+
+
+@pytest.mark.parametrize('config', [{}, {'momentum_threshold': 0.001, 'volume_accel_threshold': 0.02}])
+@pytest.mark.parametrize('seed', [1, 2])
+def test_time_weighted_momentum_batch_matches_scalar(config, seed):
+    rng = random.Random(seed)
+    timestamp, volume = 1_700_000_000.0, 1e5
+    ticks = []
+    for price in tick_grid_prices(seed):
+        timestamp += rng.choice((0.5, 1, 2, 5))
+        volume = max(1e4, volume * (1 + rng.gauss(0, 0.08)))
+        ticks.append(make_tick(timestamp, price, volume))
+
+    expected = scalar_signals(TimeWeightedMomentumStrategy(config), ticks)
+    actual = TimeWeightedMomentumStrategy(config).generate_signals_batch(
+        [t.timestamp for t in ticks], [t.price for t in ticks], [t.volume_24h for t in ticks])
+
+    assert expected.any()
+    np.testing.assert_array_equal(actual, expected)
+
+
+@pytest.mark.parametrize('config', [{}, {'cooldown_seconds': 5, 'min_volume': 2000}])
+@pytest.mark.parametrize('seed', [1, 2])
+def test_spread_capture_batch_matches_scalar(config, seed):
+    rng = random.Random(seed)
+    ticks = []
+    for i, mid in enumerate(tick_grid_prices(seed)):
+        mid = min(0.9, max(0.1, mid))
+        half_spread = rng.choice((0.001, 0.002, 0.003, 0.005))
+        bid, ask = mid - half_spread, mid + half_spread
+        price = rng.choice((bid, mid, ask))
+        volume = rng.choice((None, 0.0, 100.0, 1000.0, 5000.0))
+        ticks.append(MarketData(
+            timestamp=float(i), asset='BTC', price=price, bid=bid, ask=ask, mid=mid, vwap=mid,
+            spread_bps=0.0, volume_24h=1e5, volume=volume,
+        ))
+
+    expected = scalar_signals(SpreadCaptureStrategy(config), ticks)
+    actual = SpreadCaptureStrategy(config).generate_signals_batch(
+        [t.timestamp for t in ticks], [t.bid for t in ticks], [t.ask for t in ticks],
+        [t.mid for t in ticks], [t.price for t in ticks], [t.volume for t in ticks])
+    ungated = SpreadCaptureStrategy(config).generate_signals_batch(
+        [t.timestamp for t in ticks], [t.bid for t in ticks], [t.ask for t in ticks],
+        [t.mid for t in ticks], [t.price for t in ticks])
+
+    assert expected.any()
+    np.testing.assert_array_equal(actual, expected)
+    assert (ungated != expected).any()